@@ -3,11 +3,10 @@ Enhanced MCP server for knowledge graph memory.
 """
 
 import argparse
-import asyncio
 import sys
 from .context import ctx
 from .iq_logging import logger
-from .server import start_server
+from .server import run_sync
 from .version import IQ_MCP_VERSION
 
 
@@ -26,7 +25,7 @@ def main():
         ctx.init()
         logger.info(f"🔍 Memory path: {ctx.settings.memory_path}")
         logger.debug("🚀 Starting IQ-MCP server...")
-        asyncio.run(start_server())
+        run_sync()
     except KeyboardInterrupt:
         logger.info("👋 Received KeyboardInterrupt, shutting down gracefully...")
         exit(0)
@@ -0,0 +1,113 @@
+"""
+In-process caches for tool results.
+
+`TTLCache` keeps results around; `SingleFlight` coalesces concurrent calls that would compute the
+same result, so a burst of identical requests only does the work once.
+
+Callers should include the manager's `graph_version` in their cache keys, so that any write to the
+graph makes older entries unreachable. The TTL bounds how long a result can outlive changes made
+outside this process (e.g. edits to the memory file or to Supabase).
+
+Usage:
+    from .cache import TTLCache
+
+    _cache = TTLCache(maxsize=256, ttl=300)
+
+    key = (manager.graph_version, query)
+    result = _cache.get(key)
+    if result is None:
+        result = await compute(query)
+        _cache.set(key, result)
+
+    _flights = SingleFlight()
+    result = await _flights.do(key, lambda: compute(query))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    A least-recently-used cache whose entries also expire `ttl` seconds after being set.
+
+    Not thread-safe; intended for use from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if it is missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache `value` under `key`, evicting the least recently used entries if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Share one in-flight computation between concurrent callers asking for the same key.
+
+    The first caller for a key starts the work; callers that arrive before it finishes await the
+    same result (or exception). Nothing is kept once the work is done. Not thread-safe; intended
+    for use from the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of `fn()`, or of the call already in flight for `key`."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # Shield the shared task so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark any exception as retrieved, in case every caller was cancelled before it finished
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -114,7 +114,12 @@ class AppContext:
 
     @property
     def supabase(self) -> "SupabaseManager | None":
-        """Get Supabase manager (None if disabled). Raises if not initialized."""
+        """
+        Get Supabase manager (None if disabled). Raises if not initialized.
+
+        Only created when Supabase integration is enabled, so checking this alone is enough to
+        decide whether to use Supabase.
+        """
         if not self._initialized:
             raise RuntimeError("AppContext not initialized. Call ctx.init() first.")
         return self._supabase
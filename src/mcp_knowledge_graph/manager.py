@@ -5,12 +5,17 @@ This module contains the core business logic for managing the knowledge graph,
 including CRUD operations, temporal observation handling, and smart cleanup.
 """
 
-import json
+import asyncio
+import functools
+import os
 import shutil
+from collections import Counter
 from datetime import datetime, timezone, date
 from typing import Any, TYPE_CHECKING
 from pathlib import Path
 from uuid import uuid4
+from pydantic import ConfigDict, TypeAdapter
+from pydantic_core import to_json
 from .context import ctx
 from .iq_logging import logger
 from .models import (
@@ -33,11 +38,54 @@ from .models import (
     KnowledgeGraphException,
     MemoryRecord,
     GraphMeta,
+    _USER_SENTINELS,
 )
 
 if TYPE_CHECKING:
     from .supabase_manager import SupabaseManager, EmailSummary
 
+# Parses a JSON-encoded list of names/IDs in one call (numbers are accepted as strings)
+_STR_LIST = TypeAdapter(list[str], config=ConfigDict(coerce_numbers_to_str=True))
+
+
+def ensure_string_list(value: list[str] | str | None) -> list[str]:
+    """
+    Normalize an ids/names argument to a flat list of strings. Accepts a single string or a list,
+    where any string may itself be a JSON-encoded list (as some clients send them). None items are
+    skipped.
+    """
+    if value is None:
+        return []
+    resolved: list[str] = []
+    for item in [value] if isinstance(value, str) else value:
+        if item is None:
+            continue
+        item = str(item)
+        if item.lstrip().startswith("["):
+            try:
+                resolved.extend(_STR_LIST.validate_json(item))
+                continue
+            except ValueError:
+                pass  # Not a list of strings; treat it as a regular string
+        resolved.append(item)
+    return resolved
+
+
+def _exclusive(method):
+    """
+    (Internal) Run a graph-writing manager method under the manager's write lock.
+
+    Writes load the graph, change it and save it back, awaiting in between. Without the lock, two
+    concurrent writes could load the same graph and the second save would drop the first's changes.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "KnowledgeGraphManager", *args: Any, **kwargs: Any) -> Any:
+        async with self._write_lock:
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class KnowledgeGraphManager:
     """
@@ -58,6 +106,10 @@ class KnowledgeGraphManager:
         self.memory_file_path = Path(memory_file_path)
         # Ensure the directory exists
         self.memory_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Incremented on every save; used by callers to invalidate cached results
+        self._graph_version = 0
+        # Held by every method that writes the graph (see `_exclusive`)
+        self._write_lock = asyncio.Lock()
 
     @classmethod
     def from_context(cls) -> "KnowledgeGraphManager":
@@ -66,6 +118,11 @@ class KnowledgeGraphManager:
         """
         return cls(ctx.settings.memory_path)
 
+    @property
+    def graph_version(self) -> int:
+        """A counter that changes whenever this manager writes the graph. Include it in cache keys."""
+        return self._graph_version
+
     # ---------- Alias helpers ----------
     def _get_entity_by_name_or_alias(self, graph: KnowledgeGraph, identifier: str) -> Entity | None:
         """Return the first entity whose name or aliases match the identifier (case-insensitive). If no entity is found, returns None."""
@@ -99,6 +156,37 @@ class KnowledgeGraphManager:
                 return e
         return None
 
+    @staticmethod
+    def _index_entities_by_id(graph: KnowledgeGraph) -> dict[EntityID, Entity]:
+        """
+        (Internal) Map entity IDs to entities in one pass, for resolving several IDs against the same
+        graph. The first entity wins if an ID is duplicated, matching `_get_entity_by_id`.
+        """
+        index: dict[EntityID, Entity] = {}
+        for e in graph.entities:
+            if e.id:
+                index.setdefault(e.id, e)
+        return index
+
+    @staticmethod
+    def _index_entities_by_name(graph: KnowledgeGraph) -> dict[str, Entity]:
+        """
+        (Internal) Map lowercased names and aliases to entities in one pass, for resolving several
+        names against the same graph. Earlier entities win, matching `_get_entity_by_name_or_alias`.
+        """
+        index: dict[str, Entity] = {}
+        for e in graph.entities:
+            if e.name:
+                index.setdefault(e.name.lower(), e)
+            try:
+                for alias in e.aliases:
+                    if isinstance(alias, str) and alias.strip():
+                        index.setdefault(alias.strip().lower(), e)
+            except Exception:
+                # In case legacy data has non-list or invalid aliases field
+                pass
+        return index
+
     def _get_user_linked_entity(self, graph: KnowledgeGraph) -> Entity:
         """Return the user-linked entity. It should exist, so an error is raised if it doesn't."""
         try:
@@ -113,7 +201,10 @@ class KnowledgeGraphManager:
         return entity.name if entity else identifier
 
     def _resolve_entity_identifier(
-        self, graph: KnowledgeGraph, identifier: str | EntityID
+        self,
+        graph: KnowledgeGraph,
+        identifier: str | EntityID,
+        id_index: dict[EntityID, Entity] | None = None,
     ) -> Entity | None:
         """
         Resolve an entity identifier (ID or name/alias) to an Entity object.
@@ -124,6 +215,8 @@ class KnowledgeGraphManager:
         Args:
             graph: The knowledge graph to search
             identifier: Entity ID (8-char alphanumeric) or name/alias (string)
+            id_index: Optional ID index of the graph (see `_index_entities_by_id`), for callers
+                resolving many identifiers
 
         Returns:
             Entity if found, None otherwise
@@ -135,7 +228,10 @@ class KnowledgeGraphManager:
 
         # Try ID lookup first (8-char alphanumeric)
         if len(identifier_str) == 8 and identifier_str.isalnum():
-            entity = self._get_entity_by_id(graph, identifier_str)
+            if id_index is not None:
+                entity = id_index.get(identifier_str)
+            else:
+                entity = self._get_entity_by_id(graph, identifier_str)
             if entity:
                 return entity
 
@@ -230,7 +326,17 @@ class KnowledgeGraphManager:
         except Exception as e:
             raise KnowledgeGraphException(f"Error validating entity ID: {e}")
 
-    def _validate_entity(self, entity: Entity, graph: KnowledgeGraph) -> Entity:
+    @staticmethod
+    def _entity_signature(entity: Entity) -> str:
+        """
+        (Internal) Returns a JSON signature of an entity's contents, excluding its ID. Entities with
+        equal signatures are copies of each other.
+        """
+        return entity.model_dump_json(exclude_none=True, exclude={"id"})
+
+    def _validate_entity(
+        self, entity: Entity, graph: KnowledgeGraph, signatures: Counter[str] | None = None
+    ) -> Entity:
         """
         Validates an entity object against the knowledge graph. Intended for use during loading and
         validation of the graph.
@@ -244,34 +350,36 @@ class KnowledgeGraphManager:
         Args:
             entity: The entity to validate.
             graph: The knowledge graph to use to get the entities list.
+            signatures: Counts of entity signatures across the graph (see `_entity_signature`). If
+                provided, duplicates are detected with a lookup instead of comparing every entity.
 
         Returns:
             The Entity with the ID set and validated against the provided graph.
         """
         entities_list = graph.entities
+        signature = self._entity_signature(entity)
 
         # Ensure the entity actually exists in the graph without mutating the list under iteration
         try:
-            if entity not in entities_list:
+            present = signature in signatures if signatures is not None else entity in entities_list
+            if not present:
                 raise ValueError("entity not present in entities list")
         except Exception as e:
             raise KnowledgeGraphException(f"Entity {entity.name} must exist in graph: {e}")
 
-        # Ensure the entity has a valid ID
+        # Make sure this isn't a copy of another entity with a different id
         try:
-            if entity.id in entities_list:
-                logger.warning(f"Entity {entity.name} has a duplicate ID: {entity.id}")
-
-            # Also make sure this isn't a copy of another with a different id
-            # Compare against all other entities without mutating the source list
-            others = [e for e in entities_list if e is not entity]
-            other_entity_dicts = [e.model_dump(exclude_none=True, exclude={"id"}) for e in others]
-            entity_no_id = entity.model_dump(exclude_none=True, exclude={"id"})
-            for e_dict in other_entity_dicts:
-                if e_dict == entity_no_id:
-                    raise KnowledgeGraphException(
-                        f"Entity {entity.id} is a duplicate of an existing entity"
-                    )
+            if signatures is not None:
+                is_copy = signatures[signature] > 1
+            else:
+                is_copy = any(
+                    e is not entity and self._entity_signature(e) == signature
+                    for e in entities_list
+                )
+            if is_copy:
+                raise KnowledgeGraphException(
+                    f"Entity {entity.id} is a duplicate of an existing entity"
+                )
         except Exception as e:
             raise KnowledgeGraphException(f"Error validating existing entity ID: {e}")
 
@@ -349,42 +457,69 @@ class KnowledgeGraphManager:
         except Exception as e:
             raise KnowledgeGraphException(f"Error getting entities from relation: {e}")
 
+    @staticmethod
+    def _get_relations_index(graph: KnowledgeGraph) -> dict[EntityID, list[Relation]]:
+        """
+        (Internal) Index the graph's relations by endpoint ID. Each relation is listed under both its
+        'from' and 'to' entity (once for self-relations), in graph order.
+        """
+        index: dict[EntityID, list[Relation]] = {}
+        for r in graph.relations:
+            index.setdefault(r.from_id, []).append(r)
+            if r.to_id != r.from_id:
+                index.setdefault(r.to_id, []).append(r)
+        return index
+
     def _get_relations_from_entities(
         self, entities: list[Entity], graph: KnowledgeGraph
     ) -> list[Relation]:
         """
         (Internal) Get the relations to and from each entity in a list of entities.
         """
+        relations_index = self._get_relations_index(graph)
         relations = []
         for entity in entities:
             try:
-                for r in graph.relations:
-                    if r.from_id == entity.id or r.to_id == entity.id:
-                        relations.append(r)
+                relations.extend(relations_index.get(entity.id, ()))
             except Exception as e:
                 logger.error(f"Error getting relations from entity {entity.name}: {e}")
                 continue
         return relations
 
-    async def get_relations_from_entities(self, entities: list[Entity]) -> list[Relation]:
+    async def get_relations_from_entities(
+        self, entities: list[Entity], graph: KnowledgeGraph | None = None
+    ) -> list[Relation]:
         """
         Get the relations to and from each entity in a list of entities. To get relations from a single entity, use get_relations_from_entity().
+
+        Pass `graph` if the caller has already loaded it, to avoid loading it again.
         """
-        graph = await self._load_graph()
+        if graph is None:
+            graph = await self._load_graph()
         return self._get_relations_from_entities(entities=entities, graph=graph)
 
-    async def get_relations_from_entity(self, entity: Entity) -> list[Relation]:
+    async def get_relations_from_entity(
+        self, entity: Entity, graph: KnowledgeGraph | None = None
+    ) -> list[Relation]:
         """
         Get the relations to and from a single entity. To get relations from multiple entities, use get_relations_from_entities().
+
+        Pass `graph` if the caller has already loaded it, to avoid loading it again.
         """
-        graph = await self._load_graph()
+        if graph is None:
+            graph = await self._load_graph()
         return self._get_relations_from_entities(entities=[entity], graph=graph)
 
-    async def get_relations_from_id(self, entity_id: str) -> list[Relation]:
+    async def get_relations_from_id(
+        self, entity_id: str, graph: KnowledgeGraph | None = None
+    ) -> list[Relation]:
         """
         Get the relations to and from a single entity by its ID. Returns None if no entity is found, or no relations are found.
+
+        Pass `graph` if the caller has already loaded it, to avoid loading it again.
         """
-        graph = await self._load_graph()
+        if graph is None:
+            graph = await self._load_graph()
         entity = self._get_entity_by_id(graph=graph, id=entity_id)
         if not entity:
             return None
@@ -468,7 +603,7 @@ class KnowledgeGraphManager:
         Returns:
             The Knowledge Graph
         """
-        if ctx.settings.supabase_enabled and ctx.supabase and not force_local:
+        if ctx.supabase and not force_local:
             logger.info("Supabase integration enabled, loading graph from Supabase")
             graph = await ctx.supabase.get_knowledge_graph()
             logger.info("☁️ Supabase graph read successfully!")
@@ -510,6 +645,17 @@ class KnowledgeGraphManager:
             except Exception as e:
                 raise RuntimeError(f"Failed to initialize memory file: {e}")
 
+        # Parsing and validation are CPU-bound and the file read blocks, so keep both off the event loop
+        return await asyncio.to_thread(self._read_graph_file)
+
+    def _read_graph_file(self) -> KnowledgeGraph:
+        """
+        (Internal) Read, parse and validate the knowledge graph from the local JSONL memory file.
+        Blocking; called from `_load_graph` in a worker thread.
+
+        Returns:
+            The validated Knowledge Graph
+        """
         # Load and parse graph components
         meta: GraphMeta | None = None
         user_info: UserIdentifier | None = None
@@ -584,10 +730,18 @@ class KnowledgeGraphManager:
         valid_entities: list[Entity] = []
         entity_errors: list[str] = []
 
+        # Clean up observations first, so that copies are compared by their final contents
+        cleaned_entities: list[Entity] = []
         for e in raw_graph.entities:
             try:
-                e = e.cleanup_observations()
-                valid_entities.append(self._validate_entity(e, raw_graph))
+                cleaned_entities.append(e.cleanup_observations())
+            except Exception as err:
+                entity_errors.append(f"Bad entity `{str(e)[:24]}...`: {err}")
+        signatures = Counter(self._entity_signature(e) for e in cleaned_entities)
+
+        for e in cleaned_entities:
+            try:
+                valid_entities.append(self._validate_entity(e, raw_graph, signatures))
             except Exception as err:
                 entity_errors.append(f"Bad entity `{str(e)[:24]}...`: {err}")
 
@@ -666,64 +820,33 @@ class KnowledgeGraphManager:
             logger.error(f"Failed to create daily backup: {e}")
             return False
 
-    async def _save_graph(self, graph: KnowledgeGraph) -> None:
+    def _write_graph_file(self, graph: KnowledgeGraph) -> None:
         """
-        Save the knowledge graph to JSONL storage.
+        (Internal) Serialize the knowledge graph to the local JSONL memory file.
+        Blocking; called from `_save_graph` in a worker thread.
 
         Args:
-            graph: The knowledge graph to save
-
-        For information on the format of the graph, see the README.md file.
+            graph: The knowledge graph to write
         """
-
-        if ctx.settings.dry_run:
-            logger.warning("⚠️ Dry run mode enabled, skipping save")
-            return
-
-        if ctx.settings.supabase_enabled and ctx.supabase:
-            try:
-                await ctx.supabase.save_knowledge_graph(graph)
-                logger.info("☁️ Supabase graph saved successfully!")
-            except Exception as e:
-                logger.error(f"Failed to save graph to Supabase: {e}")
-        logger.info(f"💾 Saving backup of graph to {self.memory_file_path}")
-
+        # Records are written to a sibling temp file as they are serialized, rather than collected and
+        # joined first, so the whole file is never held in memory at once. The temp file is then swapped
+        # in, so the memory file is never left half-written if the process is stopped mid-save
+        path = self.memory_file_path
+        tmp_path = path.with_name(path.name + ".tmp")
         try:
-            lines = []
-
-            # Save meta / user info
-            try:
+            with open(tmp_path, "wb") as f:
                 meta_payload = (graph.meta or GraphMeta()).model_dump(mode="json")
-                lines.append(
-                    json.dumps({"type": "meta", "data": meta_payload}, separators=(",", ":"))
-                )
-            except Exception as e:
-                raise RuntimeError(f"Failed to save meta: {e}")
+                f.write(to_json({"type": "meta", "data": meta_payload}))
 
-            # Save user info
-            try:
                 ui_payload = (graph.user_info or UserIdentifier.from_default()).model_dump(
                     mode="json", exclude_none=True
                 )
-                lines.append(
-                    json.dumps({"type": "user_info", "data": ui_payload}, separators=(",", ":"))
-                )
-            except Exception as e:
-                raise RuntimeError(f"Failed to save user info: {e}")
+                f.write(b"\n" + to_json({"type": "user_info", "data": ui_payload}))
 
-            # Save entities
-            try:
+                # pydantic-core serializes the entity models straight to JSON, without a dict pass
                 for e in graph.entities:
-                    record = {
-                        "type": "entity",
-                        "data": e.model_dump(mode="json", exclude_none=True),
-                    }
-                    lines.append(json.dumps(record, separators=(",", ":")))
-            except Exception as e:
-                raise RuntimeError(f"Failed to save entities: {e}")
+                    f.write(b"\n" + to_json({"type": "entity", "data": e}, exclude_none=True))
 
-            # Save relations
-            try:
                 for r in graph.relations:
                     record = {
                         "type": "relation",
@@ -734,24 +857,51 @@ class KnowledgeGraphManager:
                             include={"relation", "from_id", "to_id"},
                         ),
                     }
-                    lines.append(json.dumps(record, separators=(",", ":")))
-            except Exception as e:
-                raise RuntimeError(f"Failed to save relations: {e}")
+                    f.write(b"\n" + to_json(record))
 
-            try:
-                with open(self.memory_file_path, "w", encoding="utf-8") as f:
-                    f.write("\n".join(lines))
-            except Exception as e:
-                raise RuntimeError(f"Failed to write graph to {self.memory_file_path}: {e}")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-            logger.debug(f"💾 Successfully saved graph to {self.memory_file_path}")
+    async def _save_graph(self, graph: KnowledgeGraph) -> None:
+        """
+        Save the knowledge graph to JSONL storage.
 
-            # Create daily backup after successful save
-            self._create_daily_backup()
+        Args:
+            graph: The knowledge graph to save
 
-        except Exception as e:
-            logger.error(f"⛔ Failed to save graph: {e}")
-            raise RuntimeError(f"⛔ Failed to save graph: {e}")
+        For information on the format of the graph, see the README.md file.
+        """
+
+        if ctx.settings.dry_run:
+            logger.warning("⚠️ Dry run mode enabled, skipping save")
+            return
+
+        try:
+            if ctx.supabase:
+                try:
+                    await ctx.supabase.save_knowledge_graph(graph)
+                    logger.info("☁️ Supabase graph saved successfully!")
+                except Exception as e:
+                    logger.error(f"Failed to save graph to Supabase: {e}")
+            logger.info(f"💾 Saving backup of graph to {self.memory_file_path}")
+
+            try:
+                # Serializing and writing a large graph blocks, so keep both off the event loop
+                await asyncio.to_thread(self._write_graph_file, graph)
+                logger.debug(f"💾 Successfully saved graph to {self.memory_file_path}")
+
+                # Create daily backup after successful save
+                self._create_daily_backup()
+
+            except Exception as e:
+                logger.error(f"⛔ Failed to save graph: {e}")
+                raise RuntimeError(f"⛔ Failed to save graph: {e}")
+        finally:
+            # Bump the version only once the new contents are in place (or the save has failed), so
+            # results a concurrent reader cached from the old contents during the save become unreachable
+            self._graph_version += 1
 
     async def _get_entity_id_map(self, graph: KnowledgeGraph) -> dict[EntityID, Entity]:
         """
@@ -786,10 +936,11 @@ class KnowledgeGraphManager:
         """
         Prune outdated observations from the knowledge graph. Returns the pruned graph.
         """
+        now = datetime.now(timezone.utc)
         for entity in graph.entities:
             if not entity.observations:
                 continue
-            entity.observations = [obs for obs in entity.observations if not obs.is_outdated()]
+            entity.observations = [obs for obs in entity.observations if not obs.is_outdated(now)]
         return graph
 
     async def _prune_duplicate_observations(self, graph: KnowledgeGraph) -> KnowledgeGraph:
@@ -828,6 +979,7 @@ class KnowledgeGraphManager:
         else:
             raise ValueError("No graph or entities provided!")
 
+    @_exclusive
     async def prune_observations(self) -> None:
         """
         Prune outdated and duplicate observations from the default knowledge graph, and save the graph.
@@ -836,6 +988,7 @@ class KnowledgeGraphManager:
         pruned_graph = await self._prune_observations(graph)
         await self._save_graph(pruned_graph)
 
+    @_exclusive
     async def create_entities(
         self, new_entities: list[CreateEntityRequest]
     ) -> list[CreateEntityResult]:
@@ -853,16 +1006,15 @@ class KnowledgeGraphManager:
         # FIX: Create proper name-based lookups instead of ID-based lookups
         results: list[CreateEntityResult] = []
 
-        # Create a lookup for existing entity names and aliases (case-insensitive)
-        existing_names_lower = set()
-        existing_aliases_lower = set()
-
+        # Map existing entity names and aliases (case-insensitive) to their entities; earlier
+        # entities win, and names take precedence over aliases within an entity
+        existing: dict[str, Entity] = {}
         for entity in graph.entities:
-            existing_names_lower.add(entity.name.lower().strip())
+            existing.setdefault(entity.name.lower().strip(), entity)
             try:
                 for alias in entity.aliases or []:
                     if isinstance(alias, str) and alias.strip():
-                        existing_aliases_lower.add(alias.lower().strip())
+                        existing.setdefault(alias.lower().strip(), entity)
             except Exception:
                 # Handle cases where aliases might not be a list
                 pass
@@ -874,50 +1026,23 @@ class KnowledgeGraphManager:
             if not name_lc:
                 results.append(
                     CreateEntityResult(
-                        entity=new_entity,
+                        entity=new_entity.model_dump(exclude_none=True),
                         errors=["Entity name cannot be empty"],
                     )
                 )
                 continue
 
             # Check if the entity already exists by name or alias
-            if name_lc in existing_names_lower or name_lc in existing_aliases_lower:
-                # Find the existing entity for better error message
-                existing_entity = None
-                for entity in graph.entities:
-                    if entity.name.lower().strip() == name_lc:
-                        existing_entity = entity
-                        break
-                    try:
-                        for alias in entity.aliases or []:
-                            if isinstance(alias, str) and alias.lower().strip() == name_lc:
-                                existing_entity = entity
-                                break
-                    except Exception:
-                        pass
-                    if existing_entity:
-                        break
-
-                if existing_entity:
-                    results.append(
-                        CreateEntityResult(
-                            entity=existing_entity,
-                            errors=[
-                                f'Entity "{new_entity.name}" already exists as "{existing_entity.name}" ({existing_entity.id}); skipped'
-                            ],
-                        )
-                    )
-                else:
-                    # If we somehow can't find the conflicting entity, use dict representation
-                    results.append(
-                        CreateEntityResult(
-                            entity={
-                                "name": new_entity.name,
-                                "entity_type": new_entity.entity_type or "unknown",
-                            },
-                            errors=[f'Entity "{new_entity.name}" already exists; skipped'],
-                        )
+            existing_entity = existing.get(name_lc)
+            if existing_entity:
+                results.append(
+                    CreateEntityResult(
+                        entity=existing_entity,
+                        errors=[
+                            f'Entity "{new_entity.name}" already exists as "{existing_entity.name}" ({existing_entity.id}); skipped'
+                        ],
                     )
+                )
                 continue
 
             # If not existing, create the entity
@@ -934,21 +1059,18 @@ class KnowledgeGraphManager:
                 # Add the entity to the graph
                 graph.entities.append(entity)
 
-                # Add to existing lookups to prevent duplicates in this batch
-                existing_names_lower.add(entity.name.lower().strip())
-                try:
-                    for alias in entity.aliases or []:
-                        if isinstance(alias, str) and alias.strip():
-                            existing_aliases_lower.add(alias.lower().strip())
-                except Exception:
-                    pass
+                # Add to the existing lookup to prevent duplicates in this batch
+                existing.setdefault(entity.name.lower().strip(), entity)
+                for alias in entity.aliases or []:
+                    if isinstance(alias, str) and alias.strip():
+                        existing.setdefault(alias.lower().strip(), entity)
 
-                # Add the success to the results
-                results.append(CreateEntityResult(entity=entity, errors=None))
+                # Add the success to the results; the entity was just validated, so skip revalidation
+                results.append(CreateEntityResult.model_construct(entity=entity, errors=None))
             except Exception as e:
                 results.append(
                     CreateEntityResult(
-                        entity=new_entity,
+                        entity=new_entity.model_dump(exclude_none=True),
                         errors=[f"Failed to create entity: {str(e)}"],
                     )
                 )
@@ -965,6 +1087,7 @@ class KnowledgeGraphManager:
 
         return results
 
+    @_exclusive
     async def create_relations(
         self, relations: list[CreateRelationRequest]
     ) -> CreateRelationResult:
@@ -1030,6 +1153,7 @@ class KnowledgeGraphManager:
         await self._save_graph(graph)
         return CreateRelationResult(relations=succeeded_rels)
 
+    @_exclusive
     async def apply_observations(
         self, requests: list[ObservationRequest]
     ) -> list[AddObservationResult]:
@@ -1047,28 +1171,39 @@ class KnowledgeGraphManager:
         """
         graph = await self._load_graph()
         results: list[AddObservationResult] = []
+        # Built once, so each request is a dict lookup rather than a scan of the entities
+        id_index = self._index_entities_by_id(graph)
+        name_index: dict[str, Entity] | None = None
+        # Observation contents per entity ID, built on first use and kept up to date, so several
+        # requests for the same entity don't each rebuild it
+        contents_by_entity: dict[str, set[str]] = {}
 
         for request in requests:
             # Resolve entity by ID first, else by name/alias; support 'user' shortcut in name
+            entity: Entity | None = None
+            # Stand-in for the result when the entity can't be resolved
+            unresolved = {"name": request.entity_name, "id": request.entity_id}
             try:
                 if request.entity_id:
-                    entity = self._get_entity_by_id(graph, request.entity_id)
+                    entity = id_index.get(request.entity_id)
                 elif request.entity_name:
                     name = (request.entity_name or "").strip()
                     if (
-                        name.lower() in {"user", "__user__"}
+                        name.lower() in _USER_SENTINELS
                         and graph.user_info
                         and graph.user_info.linked_entity_id
                     ):
-                        entity = self._get_entity_by_id(graph, graph.user_info.linked_entity_id)
+                        entity = id_index.get(graph.user_info.linked_entity_id)
                     else:
-                        entity = self._get_entity_by_name_or_alias(graph, name)
+                        if name_index is None:
+                            name_index = self._index_entities_by_name(graph)
+                        entity = name_index.get(name.lower())
 
                 # If we didn't find an entity, append an error to the results and continue
                 if not entity:
                     results.append(
                         AddObservationResult(
-                            entity=entity,
+                            entity=unresolved,
                             errors=[
                                 f"Entity not found for request (name='{request.entity_name}', id='{request.entity_id}')"
                             ],
@@ -1078,20 +1213,19 @@ class KnowledgeGraphManager:
 
             # If we encountered an error, append an error to the results and continue
             except Exception as e:
-                (
-                    results.append(
-                        AddObservationResult(
-                            entity=entity,
-                            errors=[f"Error resolving entity to add observations: {e}"],
-                        )
-                    ),
+                results.append(
+                    AddObservationResult(
+                        entity=unresolved,
+                        errors=[f"Error resolving entity to add observations: {e}"],
+                    )
                 )
                 continue
 
             # Create observations with timestamps from the request
-            existing_contents: set[str] = {
-                old_obs.content for old_obs in (entity.observations or [])
-            }
+            existing_contents = contents_by_entity.get(entity.id)
+            if existing_contents is None:
+                existing_contents = {old_obs.content for old_obs in (entity.observations or [])}
+                contents_by_entity[entity.id] = existing_contents
             new_observations: list[Observation] = []
             for o in request.observations:
                 obs = Observation.from_values(o.content, o.durability)
@@ -1124,17 +1258,21 @@ class KnowledgeGraphManager:
         return self._get_entity_by_id(graph, entity_id)
 
     async def get_entities_from_relation(
-        self, relation: Relation
+        self, relation: Relation, graph: KnowledgeGraph | None = None
     ) -> (Entity | None, Entity | None):
         """
         Resolve the entities from a Relation object. Returns the 'from' entity and 'to' entity as a tuple.
+
+        Pass `graph` if the caller has already loaded it, to avoid loading it again.
         """
-        graph = await self._load_graph()
+        if graph is None:
+            graph = await self._load_graph()
 
         from_entity = self._get_entity_by_id(graph, relation.from_id)
         to_entity = self._get_entity_by_id(graph, relation.to_id)
         return from_entity, to_entity
 
+    @_exclusive
     async def cleanup_outdated_observations(self) -> CleanupResult:
         """
         Remove observations that are likely outdated based on durability and age.
@@ -1145,6 +1283,7 @@ class KnowledgeGraphManager:
         graph = await self._load_graph()
         total_removed = 0
         removed_details = []
+        now = datetime.now(timezone.utc)
 
         for entity in graph.entities:
             original_count = len(entity.observations)
@@ -1152,7 +1291,7 @@ class KnowledgeGraphManager:
             # Filter out outdated observations
             kept_observations = []
             for obs in entity.observations:
-                if obs.is_outdated():
+                if obs.is_outdated(now):
                     removed_details.append(
                         {
                             "entity_name": entity.name,
@@ -1198,6 +1337,7 @@ class KnowledgeGraphManager:
 
         return self._group_by_durability(entity.observations)
 
+    @_exclusive
     async def delete_entities(
         self, entity_names: list[str] | None = None, entity_ids: list[EntityID | str] | None = None
     ) -> None:
@@ -1205,43 +1345,41 @@ class KnowledgeGraphManager:
         Delete multiple entities and their associated relations.
 
         Args:
-            entity_names: list of entity names to delete
+            entity_names: list of entity names, aliases, or IDs to delete
             entity_ids: list of entity IDs to delete
 
             If both entity_names and entity_ids are provided, both will be used to delete the entities.
         """
         try:
-            entities_to_delete: list[Entity] = []
             graph = await self._load_graph()
+            id_index = self._index_entities_by_id(graph)
+            ids_to_delete: set[EntityID] = set()
             if entity_names:
                 for name in entity_names:
-                    entity = self._get_entity_by_name_or_alias(graph, name)
+                    entity = self._resolve_entity_identifier(graph, name, id_index)
                     if entity:
-                        entities_to_delete.append(entity)
+                        ids_to_delete.add(entity.id)
             if entity_ids:
                 for id in entity_ids:
-                    entity = self._get_entity_by_id(graph, id)
-                    if entity:
-                        entities_to_delete.append(entity)
-            if not entities_to_delete:
+                    if id in id_index:
+                        ids_to_delete.add(id)
+            if not ids_to_delete:
                 raise ValueError("No valid data provided")
 
-            # Delete the entities
-            graph.entities = [e for e in graph.entities if e not in entities_to_delete]
-
-            # Remove relations involving deleted entities
-            new_relations: list[Relation] = []
-            for r in graph.relations:
-                from_e, to_e = self._get_entities_from_relation(r, graph)
-                if from_e not in entities_to_delete and to_e not in entities_to_delete:
-                    new_relations.append(r)
-            graph.relations = new_relations
+            # Delete the entities and any relations involving them, in one pass over each list
+            graph.entities = [e for e in graph.entities if e.id not in ids_to_delete]
+            graph.relations = [
+                r
+                for r in graph.relations
+                if r.from_id not in ids_to_delete and r.to_id not in ids_to_delete
+            ]
         except Exception as e:
             raise KnowledgeGraphException(f"Error deleting entities: {e}")
 
         # If no errors, save the graph
         await self._save_graph(graph)
 
+    @_exclusive
     async def delete_observations(self, deletions: list[DeleteObservationRequest]) -> None:
         """
         Delete specific observations from entities.
@@ -1250,23 +1388,27 @@ class KnowledgeGraphManager:
             deletions: list of observation deletion requests
         """
         graph = await self._load_graph()
+        id_index = self._index_entities_by_id(graph)
+        name_index: dict[str, Entity] | None = None
 
         for deletion in deletions:
             # Resolve entity by ID first, else by name/alias; support 'user' shortcut in name
             entity: Entity | None = None
             try:
                 if getattr(deletion, "entity_id", None):
-                    entity = self._get_entity_by_id(graph, deletion.entity_id)  # type: ignore[arg-type]
+                    entity = id_index.get(deletion.entity_id)  # type: ignore[arg-type]
                 if entity is None:
                     name = (deletion.entity_name or "").strip()
                     if (
-                        name.lower() in {"user", "__user__"}
+                        name.lower() in _USER_SENTINELS
                         and graph.user_info
                         and graph.user_info.linked_entity_id
                     ):
-                        entity = self._get_entity_by_id(graph, graph.user_info.linked_entity_id)
+                        entity = id_index.get(graph.user_info.linked_entity_id)
                     else:
-                        entity = self._get_entity_by_name_or_alias(graph, name)
+                        if name_index is None:
+                            name_index = self._index_entities_by_name(graph)
+                        entity = name_index.get(name.lower())
             except Exception as e:
                 logger.error(f"Error resolving entity for deletion: {e}")
                 entity = None
@@ -1282,6 +1424,7 @@ class KnowledgeGraphManager:
 
         await self._save_graph(graph)
 
+    @_exclusive
     async def delete_relations(self, relations: list[Relation]) -> None:
         """
         Delete multiple relations from the knowledge graph.
@@ -1290,6 +1433,7 @@ class KnowledgeGraphManager:
             relations: list of relations to delete
         """
         graph = await self._load_graph()
+        id_index = self._index_entities_by_id(graph)
 
         # Build a set of (from_id, to_id, relation) tuples to delete; resolve by names if needed
         to_delete: set[tuple[str, str, str]] = set()
@@ -1297,19 +1441,19 @@ class KnowledgeGraphManager:
             # Resolve from_id - try ID first, then deprecated from_entity name field
             from_id: str | None = None
             if rel.from_id:
-                from_entity = self._resolve_entity_identifier(graph, rel.from_id)
+                from_entity = self._resolve_entity_identifier(graph, rel.from_id, id_index)
                 from_id = from_entity.id if from_entity else None
             elif rel.from_entity:  # Support deprecated from_entity name field
-                from_entity = self._resolve_entity_identifier(graph, rel.from_entity)
+                from_entity = self._resolve_entity_identifier(graph, rel.from_entity, id_index)
                 from_id = from_entity.id if from_entity else None
 
             # Resolve to_id - try ID first, then deprecated to_entity name field
             to_id: str | None = None
             if rel.to_id:
-                to_entity = self._resolve_entity_identifier(graph, rel.to_id)
+                to_entity = self._resolve_entity_identifier(graph, rel.to_id, id_index)
                 to_id = to_entity.id if to_entity else None
             elif rel.to_entity:  # Support deprecated to_entity name field
-                to_entity = self._resolve_entity_identifier(graph, rel.to_entity)
+                to_entity = self._resolve_entity_identifier(graph, rel.to_entity, id_index)
                 to_id = to_entity.id if to_entity else None
 
             if from_id and to_id and rel.relation:
@@ -1335,6 +1479,20 @@ class KnowledgeGraphManager:
         graph = await self._load_graph()
         return graph
 
+    @staticmethod
+    def _search_text(entity: Entity) -> str:
+        """
+        (Internal) Return the lowercased text `search_nodes` matches against: name, type, aliases and
+        observation content, NUL-separated so a query can't match across two fields.
+        """
+        try:
+            aliases = [a or "" for a in entity.aliases]
+        except Exception:
+            aliases = []
+        return "\0".join(
+            [entity.name, entity.entity_type, *aliases, *(o.content for o in entity.observations)]
+        ).lower()
+
     async def search_nodes(self, query: str) -> KnowledgeGraph:
         """
         Search for nodes in the knowledge graph based on a query.
@@ -1360,26 +1518,11 @@ class KnowledgeGraphManager:
         for entity in graph.entities:
             # Check entity ID
             if query == entity.id:
-                return entity
-
-            # Check entity name and type
-            name_match = query_lower in entity.name.lower()
-            type_match = query_lower in entity.entity_type.lower()
-            alias_match = False
-            try:
-                alias_match = any(query_lower in (a or "").lower() for a in entity.aliases)
-            except Exception:
-                alias_match = False
+                filtered_entities = [entity]
+                break
 
-            if name_match or type_match or alias_match:
+            if query_lower in self._search_text(entity):
                 filtered_entities.append(entity)
-                continue
-
-            # Check observations
-            for obs in entity.observations:
-                if query_lower in obs.content.lower():
-                    filtered_entities.append(entity)
-                    break
 
         # Filter relations using IDs of filtered entities
         filtered_entity_ids = {entity.id for entity in filtered_entities if entity.id}
@@ -1402,6 +1545,7 @@ class KnowledgeGraphManager:
         names: list[str] | str | None = None,
         # include_observations: bool = True,
         # include_relations: bool = True,
+        graph: KnowledgeGraph | None = None,
     ) -> list[Entity]:
         """
         Open specific nodes (entities) in the knowledge graph by their names or IDs.
@@ -1410,84 +1554,21 @@ class KnowledgeGraphManager:
         Args:
             ids: list of entity IDs to retrieve
             names: list of entity names to retrieve
+            graph: the graph to look in, if the caller has already loaded it, to avoid loading it again
 
         Returns:
 
             A list of entities that match the provided names or IDs.
         """
-        graph = await self._load_graph()
+        if graph is None:
+            graph = await self._load_graph()
         user_info = graph.user_info
         if not ids and not names:
             raise ValueError("Either ids or names must be provided")
 
-        # Check if ids is a string representation of a list
-        resolved_ids: list[str] = []
-        if ids is not None:
-            if isinstance(ids, str):
-                logger.debug(f"DEBUG: ids is a string, attempting to parse: {ids}")
-                try:
-                    # Try to parse as JSON first (for string representations of lists)
-                    parsed = json.loads(ids)
-                    if isinstance(parsed, list):
-                        resolved_ids = [str(item) for item in parsed]
-                        logger.debug(f"open_nodes: parsed ids as JSON list: {resolved_ids}")
-                    else:
-                        resolved_ids = [ids]
-                        logger.debug(f"open_nodes: treating ids as single string: {resolved_ids}")
-                except (json.JSONDecodeError, ValueError):
-                    # If JSON parsing fails, treat as single string
-                    resolved_ids = [ids]
-                    logger.debug(
-                        f"open_nodes: JSON parsing failed, treating as single string: {resolved_ids}"
-                    )
-            elif isinstance(ids, list):
-                # Handle case where list contains JSON-encoded strings
-                for id_item in ids:
-                    if id_item is None:
-                        continue
-                    id_str = str(id_item)
-                    try:
-                        # Try to parse each item as JSON in case it's a JSON-encoded list
-                        parsed = json.loads(id_str)
-                        if isinstance(parsed, list):
-                            resolved_ids.extend([str(item) for item in parsed])
-                        else:
-                            resolved_ids.append(id_str)
-                    except (json.JSONDecodeError, ValueError):
-                        # If JSON parsing fails, treat as regular string
-                        resolved_ids.append(id_str)
-                logger.debug(f"open_nodes: ids received as a list, resolved to: {resolved_ids}")
-
-        # Check if names is a string representation of a list
-        resolved_names: list[str] = []
-        if names is not None:
-            if isinstance(names, str):
-                try:
-                    # Try to parse as JSON first (for string representations of lists)
-                    parsed = json.loads(names)
-                    if isinstance(parsed, list):
-                        resolved_names = [str(item) for item in parsed]
-                    else:
-                        resolved_names = [names]
-                except (json.JSONDecodeError, ValueError):
-                    # If JSON parsing fails, treat as single string
-                    resolved_names = [names]
-            elif isinstance(names, list):
-                # Handle case where list contains JSON-encoded strings
-                for name_item in names:
-                    if name_item is None:
-                        continue
-                    name_str = str(name_item)
-                    try:
-                        # Try to parse each item as JSON in case it's a JSON-encoded list
-                        parsed = json.loads(name_str)
-                        if isinstance(parsed, list):
-                            resolved_names.extend([str(item) for item in parsed])
-                        else:
-                            resolved_names.append(name_str)
-                    except (json.JSONDecodeError, ValueError):
-                        # If JSON parsing fails, treat as regular string
-                        resolved_names.append(name_str)
+        # Either argument may arrive as a single string or a JSON-encoded list
+        resolved_ids = ensure_string_list(ids)
+        resolved_names = ensure_string_list(names)
 
         opened_nodes: list[Entity] = []
 
@@ -1495,15 +1576,15 @@ class KnowledgeGraphManager:
         try:
             if resolved_names and len(resolved_names) > 0:
                 logger.debug(f"Getting entities by names: {resolved_names}")
+                name_index = self._index_entities_by_name(graph)
                 for ident in resolved_names:
                     if not ident or not isinstance(ident, str):
                         logger.warning(f"Skipping invalid identifier: {ident}")
                         continue
 
                     # Special case for user
-                    logger.debug(f"Getting entity: {ident}")
                     if (
-                        ident.lower() in {"user", "__user__"}
+                        ident.lower() in _USER_SENTINELS
                         and user_info
                         and user_info.linked_entity_id
                     ):
@@ -1518,7 +1599,7 @@ class KnowledgeGraphManager:
                         except Exception as e:
                             logger.error(f"Error getting user-linked entity for {ident}: {e}")
                     else:
-                        entity = self._get_entity_by_name_or_alias(graph, ident)
+                        entity = name_index.get(ident.strip().lower())
                         if entity:
                             opened_nodes.append(entity)
                         else:
@@ -1531,12 +1612,13 @@ class KnowledgeGraphManager:
         try:
             if resolved_ids and len(resolved_ids) > 0:
                 logger.debug(f"Getting entities by IDs: {resolved_ids}")
+                id_index = self._index_entities_by_id(graph)
                 for entity_id in resolved_ids:
                     if not entity_id:
                         logger.warning(f"Skipping empty ID: {entity_id}")
                         continue
 
-                    entity = self._get_entity_by_id(graph, str(entity_id))
+                    entity = id_index.get(str(entity_id))
                     if entity:
                         opened_nodes.append(entity)
                     else:
@@ -1555,6 +1637,7 @@ class KnowledgeGraphManager:
 
         return result
 
+    @_exclusive
     async def merge_entities(
         self, new_entity_name: str, entity_identifiers: list[str | EntityID]
     ) -> Entity:
@@ -1589,9 +1672,10 @@ class KnowledgeGraphManager:
         graph = await self._load_graph()
 
         # Resolve entity identifiers (names, aliases, or IDs) to canonical names
+        id_index = self._index_entities_by_id(graph)
         canonical_merge_names: list[str] = []
         for ident in entity_identifiers:
-            entity = self._resolve_entity_identifier(graph, str(ident))
+            entity = self._resolve_entity_identifier(graph, str(ident), id_index)
             if not entity:
                 # Collect missing for error after this loop
                 canonical_merge_names.append(str(ident))  # keep as-is; we'll validate below
@@ -1602,6 +1686,7 @@ class KnowledgeGraphManager:
         # that is not included in the merge set, this is a conflict.
         existing_by_name = {e.name: e for e in graph.entities}
         names_in_merge_set = set(canonical_merge_names)
+        new_name_key = new_entity_name.strip().lower()
         conflict_entity: Entity | None = None
         # Direct name conflict
         if new_entity_name in existing_by_name and new_entity_name not in names_in_merge_set:
@@ -1612,10 +1697,7 @@ class KnowledgeGraphManager:
                 if e.name in names_in_merge_set:
                     continue
                 try:
-                    if any(
-                        (a or "").strip().lower() == new_entity_name.strip().lower()
-                        for a in e.aliases
-                    ):
+                    if any((a or "").strip().lower() == new_name_key for a in e.aliases):
                         conflict_entity = e
                         break
                 except Exception:
@@ -1653,22 +1735,19 @@ class KnowledgeGraphManager:
 
         # If an entity exists with the target name and is in the merge list,
         # we will effectively replace it with the merged result. Remove all originals first.
-        names_to_remove = set(canonical_merge_names)
-        graph.entities = [e for e in graph.entities if e.name not in names_to_remove]
+        graph.entities = [e for e in graph.entities if e.name not in names_in_merge_set]
 
         # Merge aliases: include all prior names and aliases, excluding the new name
         merged_aliases: set[str] = set()
         for ent in entities_to_merge:
-            if ent.name.strip().lower() != new_entity_name.strip().lower():
+            if ent.name.strip().lower() != new_name_key:
                 merged_aliases.add(ent.name)
             try:
                 for a in ent.aliases:
-                    if (
-                        isinstance(a, str)
-                        and a.strip()
-                        and a.strip().lower() != new_entity_name.strip().lower()
-                    ):
-                        merged_aliases.add(a)
+                    if isinstance(a, str):
+                        alias_key = a.strip().lower()
+                        if alias_key and alias_key != new_name_key:
+                            merged_aliases.add(a)
             except Exception:
                 pass
 
@@ -1684,7 +1763,7 @@ class KnowledgeGraphManager:
 
         # Rewrite relations to point to the new entity where applicable (by IDs)
         ids_to_rewrite = {
-            existing_by_name[name].id for name in names_to_remove if existing_by_name[name].id
+            existing_by_name[name].id for name in names_in_merge_set if existing_by_name[name].id
         }
         for rel in graph.relations:
             if rel.from_id in ids_to_rewrite:
@@ -1724,6 +1803,7 @@ class KnowledgeGraphManager:
         logger.warning("get_user_linked_entity() is deprecated, use get_user_entity() instead")
         return self.get_user_entity()
 
+    @_exclusive
     async def update_user_info(self, new_user_info: UserIdentifier) -> UserIdentifier:
         """Update the user's identifying information in the graph.
         Accepts a fully-formed `UserIdentifier` which will be validated against the current graph.
@@ -1737,6 +1817,7 @@ class KnowledgeGraphManager:
         await self._save_graph(graph)
         return validated
 
+    @_exclusive
     async def update_entity(
         self,
         identifier: str | None = None,
@@ -1879,7 +1960,7 @@ class KnowledgeGraphManager:
         include_reviewed: bool = False,
     ) -> list["EmailSummary"]:
         """Get email summaries from Supabase. If Supabase integration is disabled, this returns an empty list."""
-        if ctx.settings.supabase_enabled and ctx.supabase:
+        if ctx.supabase:
             return await ctx.supabase.get_email_summaries(
                 from_date=from_date, to_date=to_date, include_reviewed=include_reviewed
             )
@@ -1894,7 +1975,7 @@ class KnowledgeGraphManager:
             logger.warning("(Supabase) Dry run mode enabled, skipping mark_as_reviewed()")
             return
 
-        if ctx.settings.supabase_enabled and ctx.supabase:
+        if ctx.supabase:
             try:
                 await ctx.supabase.mark_as_reviewed(email_summaries)
                 logger.info(
@@ -6,6 +6,7 @@ including entities, relations, and temporal observations with durability metadat
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Literal, Annotated
 from uuid import uuid4
 from pydantic import (
@@ -27,8 +28,9 @@ _GRAPHEMES = re.compile(r"\X")
 _HAS_EMOJI = re.compile(r"(\p{Extended_Pictographic}|\p{Regional_Indicator})")
 
 
+@lru_cache(maxsize=1024)
 def is_emoji(s: str) -> bool:
-    """Check if a string is a valid emoji."""
+    """Check if a string is a valid emoji. Results are cached, since the same icons recur across entities."""
     s = s.strip()
     g = _GRAPHEMES.findall(s)
     return len(g) == 1 and _HAS_EMOJI.search(g[0]) is not None
@@ -46,6 +48,9 @@ def validate_id_simple(id: str) -> str:
     return id
 
 
+# Entity names that stand for the user (compared after strip + lower)
+_USER_SENTINELS: frozenset[str] = frozenset({"__user__", "user"})
+
 # Constrained ID type for entity/relation IDs (8-char alphanumeric)
 EntityID = Annotated[
     str, Field(min_length=8, max_length=8, pattern=r"^[A-Za-z0-9]{8}$", strict=True)
@@ -76,6 +81,14 @@ class DurabilityType(str, Enum):
     TEMPORARY = "temporary"  # Relevant for ~1 month (e.g., "Currently learning TypeScript", "Traveling to Dominica")
 
 
+# Age in days past which an observation is outdated, by durability (permanent ones never are)
+_MAX_AGE_DAYS: dict[DurabilityType, int] = {
+    DurabilityType.LONG_TERM: 365,  # 1+ years old
+    DurabilityType.SHORT_TERM: 90,  # 3+ months old
+    DurabilityType.TEMPORARY: 30,  # 1+ month old
+}
+
+
 class Observation(BaseModel):
     """
     Observation data model.
@@ -151,31 +164,27 @@ class Observation(BaseModel):
         now = datetime.now(timezone.utc)
         return (now - ts).days
 
-    def is_outdated(self) -> bool:
+    def is_outdated(self, now: datetime | None = None) -> bool:
         """
         Check if an observation is outdated based on durability and age.
 
         Args:
-            obs: The observation to check
+            now: The current time (UTC). Pass it in when checking many observations, so the clock
+                is only read once.
 
         Returns:
             True if the observation should be considered outdated, False otherwise.
         """
+        max_age = _MAX_AGE_DAYS.get(self.durability)
+        if max_age is None:
+            return False  # Permanent observations are never outdated
+
         try:
-            days_old = self.age
+            ts = self.timestamp.replace(tzinfo=timezone.utc)
+            days_old = ((now or datetime.now(timezone.utc)) - ts).days
         except Exception as e:
             raise ValueError(f"Error calculating age of observation: {e}")
-
-        if self.durability == DurabilityType.PERMANENT:
-            return False  # Never outdated
-        elif self.durability == DurabilityType.LONG_TERM:
-            return days_old > 365  # 1+ years old
-        elif self.durability == DurabilityType.SHORT_TERM:
-            return days_old > 90  # 3+ months old
-        elif self.durability == DurabilityType.TEMPORARY:
-            return days_old > 30  # 1+ month old
-        else:
-            return False
+        return days_old > max_age
 
 
 class Entity(BaseModel):
@@ -267,6 +276,11 @@ class Entity(BaseModel):
             return ""
         return self.icon + " "
 
+    @property
+    def is_user_sentinel(self) -> bool:
+        """Whether this entity's name marks it as standing for the user (e.g. `__user__`)."""
+        return self.name.strip().lower() in _USER_SENTINELS
+
     def to_dict(self) -> dict[str, Any]:
         """Return the entity as a JSON dictionary. Ideal for writing to storage."""
         return self.model_dump(exclude_none=True)
@@ -355,9 +369,10 @@ class Entity(BaseModel):
         Remove outdated and duplicate observations from the entity. Returns the clean entity.
         """
         # Prune outdated observations
+        now = datetime.now(timezone.utc)
         valid_observations = []
         for obs in self.observations:
-            if not obs.is_outdated():
+            if not obs.is_outdated(now):
                 valid_observations.append(obs)
             else:
                 continue
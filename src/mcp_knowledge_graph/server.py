@@ -7,19 +7,19 @@ knowledge graph operations as tools for LLM integration using FastMCP 2.11.
 
 import sys
 import asyncio
-import json
 import re
 from datetime import datetime, timezone, timedelta
 from fastmcp import FastMCP
-from pydantic import Field
-from pydantic.main import IncEx
-from pydantic.dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from pydantic import Field, TypeAdapter
+from pydantic_core import from_json, to_json
+from typing import Annotated, Any, Callable, TYPE_CHECKING
 from fastmcp.exceptions import ToolError, ValidationError
 
 from .iq_logging import logger
 from .context import ctx
-from .manager import KnowledgeGraphManager
+from .manager import KnowledgeGraphManager, ensure_string_list
 from .models import (
     DeleteEntryRequest,
     DeleteObservationRequest,
@@ -37,8 +37,12 @@ from .models import (
     UpdateEntityRequest,
 )
 from .version import IQ_MCP_VERSION
-from .supabase_manager import EmailSummary
 from .auth import get_auth_provider
+from .cache import SingleFlight, TTLCache
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it pulls in the Supabase client
+    from .supabase_manager import EmailSummary
 
 
 # Manager is initialized lazily after context init
@@ -57,10 +61,10 @@ Tools available from the manager:
 
 ## Relation Operations
 - create_relations(relations) -> CreateRelationResult
-- get_relations_from_entities(entities) -> list[Relation]
-- get_relations_from_entity(entity) -> list[Relation]
-- get_relations_from_id(entity_id) -> list[Relation]
-- get_entities_from_relation(relation) -> (Entity | None, Entity | None)
+- get_relations_from_entities(entities, graph) -> list[Relation]
+- get_relations_from_entity(entity, graph) -> list[Relation]
+- get_relations_from_id(entity_id, graph) -> list[Relation]
+- get_entities_from_relation(relation, graph) -> (Entity | None, Entity | None)
 - delete_relations(relations) -> None
 
 ## Observation Operations
@@ -91,8 +95,23 @@ Tools available from the manager:
 _auth_provider = get_auth_provider()
 mcp = FastMCP(name="iq-mcp", version=IQ_MCP_VERSION, auth=_auth_provider)
 
-
-@dataclass
+# Serialized search results, keyed by (graph version, query)
+_search_cache = TTLCache(maxsize=256, ttl=300)
+# Rendered open_nodes summaries, keyed by (graph version, ids, names, exclude_relations)
+_open_nodes_cache = TTLCache(maxsize=256, ttl=300)
+# Graph-derived sections of the read_graph summary, keyed by graph version
+_read_graph_cache = TTLCache(maxsize=4, ttl=300)
+# Rendered read_user_info output, keyed by (graph version, include_observations, include_relations)
+_user_info_cache = TTLCache(maxsize=8, ttl=300)
+# Concurrent identical lookups share one manager call
+_search_flights = SingleFlight()
+_open_flights = SingleFlight()
+# Background mark-as-reviewed tasks (referenced until done) and the message IDs they cover
+_review_tasks: set[asyncio.Task] = set()
+_reviews_in_flight: set[str] = set()
+
+
+@dataclass(slots=True, frozen=True)
 class PrintOptions:
     """
     Options for printing things such as entities, relations, or observations from the knowledge graph.
@@ -146,11 +165,129 @@ class PrintOptions:
     ordinal_separator: str = "."
 
 
+_DEFAULT_PRINT_OPTIONS = PrintOptions()
+# Used by create_entities; built once so its renderer is found in the cache without rebuilding options
+_CREATED_ENTITY_OPTIONS = PrintOptions(include_observations=True)
+
+
+# Separator for comma-separated alias lists, absorbing surrounding whitespace
+_ALIAS_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Relative dates accepted by get_email_summaries, as offsets back from now
+_RELATIVE_DATES = {
+    "today": timedelta(0),
+    "yesterday": timedelta(days=1),
+    "one day ago": timedelta(days=1),
+    "a day ago": timedelta(days=1),
+    "one week ago": timedelta(weeks=1),
+    "a week ago": timedelta(weeks=1),
+    "last week": timedelta(weeks=1),
+}
+_DAYS_AGO_RE = re.compile(r"^(\d+)\s+days?\s+ago$")
+_WEEKS_AGO_RE = re.compile(r"^(\d+)\s+weeks?\s+ago$")
+
+# Validates delete_entry observation payloads in a single call
+_DELETE_OBSERVATIONS = TypeAdapter(list[DeleteObservationRequest])
+
+# Validates delete_entry entity payloads (IDs, or names/aliases the manager resolves)
+_ENTITY_IDENTIFIERS = TypeAdapter(list[str])
+
+# Validates delete_entry relation payloads in a single call
+_DELETE_RELATIONS = TypeAdapter(list[Relation])
+
+# Fields that identify an entity add_observations couldn't update (usable as a pydantic `include`)
+_BAD_ENTITY_FIELDS = dict.fromkeys(("name", "id", "entity_type"), True)
+
+# Stand-in for relation endpoints that can't be resolved, so printing can carry on
+_MISSING_ENTITY = Entity.model_construct(
+    id="unknown", name="unknown", entity_type="unknown", observations=[], aliases=[], icon=""
+)
+
+
 #### Helper functions ####
-async def print_entities(
+@cache
+def _emoji_prefix(emoji: str) -> str:
+    """Return `emoji` followed by a space, or an empty string if emojis are disabled. Settings are fixed once the server starts, so results are cached."""
+    return "" if ctx.settings.no_emojis else f"{emoji} "
+
+
+def _parse_aliases(raw: str) -> list[str]:
+    """Parse aliases given as a stringified JSON array or a comma-separated string."""
+    s = raw.strip()
+    # Only try JSON when it looks like an array, so plain comma-separated input never raises
+    if s.startswith("["):
+        try:
+            parsed = from_json(s)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, list):
+            return [str(a) for a in parsed]
+    return [a for a in _ALIAS_SPLIT_RE.split(s) if a]
+
+
+async def _graph_if_user(entities: list[Entity]) -> KnowledgeGraph | None:
+    """Load the graph only if `entities` include the user-linked entity, which `print_entities` displays using the graph's user info."""
+    if any(e.is_user_sentinel for e in entities):
+        return await manager.read_graph()
+    return None
+
+
+@lru_cache(maxsize=4)
+def _observation_options(include_durability: bool, include_ts: bool) -> PrintOptions:
+    """Return the (shared, frozen) options `print_entities` uses for each entity's observations."""
+    return PrintOptions(include_durability=include_durability, include_ts=include_ts)
+
+
+@lru_cache(maxsize=32)
+def _entity_renderer(options: PrintOptions) -> Callable[[int, str, str, str, str], str]:
+    """
+    Build a function that renders a single entity line for `print_entities`, with the list and link
+    options already resolved. Cached per `PrintOptions` value.
+
+    The returned function takes `(ordinal, icon, name, entity_type, entity_id)`.
+    """
+    ind = " " * options.indent if options.indent > 0 else ""
+    ol = options.ol if options.ul else False
+    os = options.ordinal_separator if ol else ""
+    # Special case: if both ul and ol are False, omit pre-entity string
+    list_item = bool(options.ul or ol)
+    link_open, link_close = ("[", "]") if options.md_links else ("", " ")
+
+    def lit(text: str) -> str:
+        """Escape option text for use as a literal in a `str.format` template."""
+        return text.replace("{", "{{").replace("}", "}}")
+
+    # Resolve every option into a single template, so rendering an entity is one format call.
+    # With default options: [👤 John Doe (person)](id:12345678)
+    if ol:
+        template = f"{lit(ind)}{{0}}{lit(os)} "
+    elif list_item:
+        template = lit(f"{ind}{options.bullet}{os} ")
+    else:
+        template = ""
+    template += lit(link_open) + "{1}{2}"
+    if options.include_types:
+        template += " ({3})"
+    template += lit(link_close)
+    if options.include_ids:
+        template += "(id:{4})"
+    template += lit(options.separator)
+
+    return template.format
+
+
+def _format_ts(ts: datetime) -> str:
+    """Format a timestamp as `YYYY-MM-DD HH:MM:SS`. Equivalent to `strftime`, without the locale machinery."""
+    return (
+        f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} "
+        f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+    )
+
+
+def print_entities(
     entities: list[Entity] | None = None,
     graph: KnowledgeGraph | None = None,
-    options: PrintOptions = PrintOptions(),
+    options: PrintOptions = _DEFAULT_PRINT_OPTIONS,
     exclude_user: bool | None = None,
 ):
     """
@@ -161,7 +298,8 @@ async def print_entities(
 
     Args:
 
-    - graph: The knowledge graph to print entities from. Required if entities is not provided.
+    - graph: The knowledge graph to print entities from. Required if entities is not provided, or
+      if they may include the user-linked entity (which is displayed using the graph's user info).
     - entities: The list of entities to print. Required if graph is not provided.
     - options: The options (PrintOptions object)to use for printing the entities. If not provided, default values will be used.
     - exclude_user: Whether to skip printing the user-linked entity data. If not provided, default PrintOptions value will be used. Provided here for convenience, but can be set in the options object.
@@ -193,122 +331,73 @@ async def print_entities(
         - `indent` is applied only to the entity list, not the prologue or epilogue
     """
 
-    if not entities:
-        graph = graph or await manager.read_graph()
+    if not entities and graph is not None:
         entities = graph.entities
-    else:
-        e_names = []
-        for e in entities:
-            e_names.append(e.name)
 
     if not entities:
         raise ToolError("No entities provided")
-    else:
-        e_names = []
-        for e in entities:
-            e_names.append(e.name)
 
     if exclude_user is None:
         exclude_user = options.exclude_user
 
     # Resolve options
     prologue = options.prologue
-    separator = options.separator
     epilogue = options.epilogue
-    md_links = options.md_links
-    include_ids = options.include_ids
-    include_types = options.include_types
     include_observations = options.include_observations
-    include_durability = options.include_durability
-    include_ts = options.include_ts
+    # Shared by every entity's observation list
+    obs_options = _observation_options(options.include_durability, options.include_ts)
     # include_relations = options.include_relations
-    ind = " " * options.indent if options.indent > 0 else ""
-    ul = options.ul
-    ol = options.ol if ul else ""
-    bullet = options.bullet
-    os = options.ordinal_separator if ol else ""
+    render = _entity_renderer(options)
+    use_emojis = not ctx.settings.no_emojis
+
+    # Skipped entities don't take an ordinal
+    if exclude_user is True:
+        entities = [e for e in entities if not e.is_user_sentinel]
 
     # Start rendering
-    result = prologue
+    parts: list[str] = [prologue]
     try:
-        i = 1
-        for e in entities:
-            ord = i if ol else bullet
-            if e.name.lower().strip() == "__user__" or e.name.lower().strip() == "user":
-                if exclude_user is True:
-                    continue
-                else:
-                    graph = graph or await manager.read_graph()
-                    user_info = graph.user_info
-                    id = user_info.linked_entity_id
-                    icon = e.icon_(use_emojis=not ctx.settings.no_emojis)
-                    name = user_info.preferred_name
-                    type = "user"
-            else:
-                id = e.id
-                icon = e.icon_(use_emojis=not ctx.settings.no_emojis)
-                name = e.name
-                type = e.entity_type
-
-            # Compose pre-entity string (indentation, bullet, ordinal, spacer)
-            # Special case: if both ul and ol are False, omit pre-entity string
-            if not ul and not ol:
-                display_pre = ""
+        for i, e in enumerate(entities, 1):
+            if e.is_user_sentinel:
+                if graph is None:
+                    raise ToolError("A graph is required to print the user-linked entity")
+                user_info = graph.user_info
+                line = render(
+                    i, e.icon_(use_emojis), user_info.preferred_name, "user", user_info.linked_entity_id
+                )
             else:
-                display_pre: str = f"{ind}{ord}{os} "
-
-            # Compose entity string (entity icon, name, id, type)
-            display = (
-                f"{'[' if md_links else ''}"
-                f"{icon}{name}"
-                f"{' (' + type + ')' if include_types else ''}"
-                f"{']' if md_links else ' '}"
-                f"{'(id:' + id + ')' if include_ids else ''}"
-            )
-            # With default options: [👤 John Doe](12345678) (person)
-            # Example with md_links=False: 👤 John Doe (person, ID: 12345678)
-
-            # Compose post-entity string (separator)
-            display_post = f"{separator}"
-
-            result += f"{display_pre}{display}{display_post}"
+                line = render(i, e.icon_(use_emojis), e.name, e.entity_type, e.id)
+            parts.append(line)
 
             # Print the entity's observations
             if include_observations:
-                result += await print_observations(
-                    e.observations,
-                    options=PrintOptions(
-                        include_durability=include_durability,
-                        include_ts=include_ts,
-                    ),
-                )
+                parts.append(print_observations(e.observations, options=obs_options))
 
             # Print relations about the entity (dynamic, from graph relations)
             # TODO: implement - probably want to robustly remove duplicates
             # if include_relations: ...
-            i += 1
 
         # Finally, add the epilogue
-        result += epilogue
+        parts.append(epilogue)
 
-        return result
+        return "".join(parts)
     except Exception as e:
         raise ToolError(f"Failed to print entities: {e}")
 
 
-async def print_relations(
+def print_relations(
+    graph: KnowledgeGraph,
     relations: list[Relation] | None = None,
-    graph: KnowledgeGraph | None = None,
-    options: PrintOptions = PrintOptions(),
+    options: PrintOptions = _DEFAULT_PRINT_OPTIONS,
 ) -> str:
     """
     Print relations from the graph, or from a list of relations, in a readable format. Resolves entity IDs to names wherever possible.
-    If no arguments are provided, the graph will be read and all relations will be printed.
+    If no relations are provided, all relations in the graph will be printed.
 
     Args:
 
-    - graph: The knowledge graph to print relations from. Required if relations is not provided.
-    - relations: The list of relations to print. Required.
+    - graph: The knowledge graph the relations belong to, used to resolve entity IDs. Required.
+    - relations: The list of relations to print. Defaults to all relations in the graph.
     - options: The options to use for printing the relations. If not provided, default values will be used.
 
     Display format:
@@ -326,10 +415,16 @@ async def print_relations(
     <epilogue is double newline>
     ```
     """
-    graph = graph or await manager.read_graph()
     relations = relations or graph.relations
-    user_info = graph.user_info
-    entity_id_map = await manager.get_entity_id_map(graph)
+    user_name = graph.user_info.preferred_name + " (user)"
+    entity_id_map: dict[str, Entity] = {}
+    # IDs of entities standing for the user, which display as the user's preferred name
+    user_ids: set[str] = set()
+    for e in graph.entities:
+        if e.id:
+            entity_id_map[e.id] = e
+            if e.is_user_sentinel:
+                user_ids.add(e.id)
 
     # Resolve formatting options
     prologue = options.prologue
@@ -343,75 +438,32 @@ async def print_relations(
     bullet = options.bullet
     os = options.ordinal_separator
     separator = options.separator
-    i = 1  # for ordered list ordinals
+    use_emojis = not ctx.settings.no_emojis
     ind = " " * indent if indent > 0 else ""  # no negatives allowed
-    if ol:
-        ord = str(i)
-    else:
-        ord = bullet
-        os = ""
-
-    lines: list[str] = [prologue]
-    for r in relations:
-        try:
-            a = entity_id_map.get(r.from_id, None)
-            b = entity_id_map.get(r.to_id, None)
-        except Exception as e:
-            raise ToolError(f"Failed to get relation entities: {e}")
-        if not a or not isinstance(a, Entity):
-            logger.error(f"Failed to get 'from' entity ({r.from_id}) from relation")
-        if not b or not isinstance(b, Entity):
-            logger.error(f"Failed to get 'to' entity ({r.to_id}) from relation")
-
-        # For A: If this is the user-linked entity, use the user's preferred name instead; if name is missing, use "unknown"
-        if a.name.lower().strip() == "__user__" or a.name.lower().strip() == "user":
-            a_name = user_info.preferred_name + " (user)"
-        else:
-            a_name = a.name
-
-        # For B: If this is the user-linked entity, use the user's preferred name instead; if name is missing, use "unknown"
-        if b.name.lower().strip() == "__user__" or b.name.lower().strip() == "user":
-            b_name = user_info.preferred_name + " (user)"
-        else:
-            b_name = b.name
-
-        a_icon = a.icon_(use_emojis=not ctx.settings.no_emojis)
-        a_id = a.id
-        a_type = a.entity_type
-
-        b_icon = b.icon_(use_emojis=not ctx.settings.no_emojis)
-        b_id = b.id
-        b_type = b.entity_type
-
-        # Compose pre-entity string (list stuff like indentation, bullet, ordinal, etc.)
-        # Special case: if both ul and ol are False, omit pre-relation string
-        if not ul and not ol:
-            display_pre = ""
-        else:
-            display_pre: str = f"{ind}{ord}{os} "
-
-        # Resolve entity properties
-
-        # Compose relation to and from strings
+    # Compose pre-relation string (list stuff like indentation, bullet, ordinal, etc.); only
+    # numbered lists vary it per relation.
+    # Special case: if both ul and ol are False, omit pre-relation string
+    bullet_pre = f"{ind}{bullet} " if ul else ""
+
+    def link(entity_id: str, direction: str) -> str:
+        e = entity_id_map.get(entity_id, _MISSING_ENTITY)
+        if e is _MISSING_ENTITY:
+            logger.error(f"Failed to get '{direction}' entity ({entity_id}) from relation")
+        name = user_name if entity_id in user_ids else e.name
         if md_links and include_ids:
-            link_from = f"[{a_icon}{a_name}](id:{a_id})"
-            link_to = f"[{b_icon}{b_name}](id:{b_id})"
-        elif md_links and not include_ids:
-            link_from = f"{a_icon}{a_name}"
-            link_to = f"{b_icon}{b_name}"
+            text = f"[{e.icon_(use_emojis)}{name}](id:{e.id})"
+        elif not md_links and include_ids:
+            text = f"{e.icon_(use_emojis)}{name} ({e.id})"
         else:
-            link_from = f"{a_icon}{a_name}"
-            link_to = f"{b_icon}{b_name}"
-            if include_ids:
-                link_from += f" ({a_id})"
-                link_to += f" ({b_id})"
+            text = f"{e.icon_(use_emojis)}{name}"
         if include_types:
-            link_from += f" ({a_type})"
-            link_to += f" ({b_type})"
+            text += f" ({e.entity_type})"
+        return text
 
-        # Compose entity string (entity icon, name, id, type)
-        lines.append(f"{display_pre}{link_from} {r.relation} {link_to}")
-        i += 1
+    lines: list[str] = [prologue]
+    for i, r in enumerate(relations, 1):
+        pre = f"{ind}{i}{os} " if ol else bullet_pre
+        lines.append(f"{pre}{link(r.from_id, 'from')} {r.relation} {link(r.to_id, 'to')}")
 
     # Finally, add the epilogue
     result = separator.join(lines) + epilogue
@@ -419,8 +471,8 @@ async def print_relations(
     return result
 
 
-async def print_observations(
-    observations: list[Observation], options: PrintOptions = PrintOptions()
+def print_observations(
+    observations: list[Observation], options: PrintOptions = _DEFAULT_PRINT_OPTIONS
 ) -> str:
     """
     Print all the observations of an entity in a readable format.
@@ -441,36 +493,36 @@ async def print_observations(
 
     os = options.ordinal_separator if ol else ""
     ind = " " * options.indent if options.indent > 0 else ""
+    include_ts = options.include_ts
+    include_durability = options.include_durability
+    # Only numbered lists vary the prefix per observation
+    bullet_pre = f"{ind}{bullet}{os} "
 
-    result_str = prologue
-    i = 1
-    for o in observations:
+    parts: list[str] = [prologue]
+    for i, o in enumerate(observations, 1):
         try:
-            ord = str(i) if ol else bullet
-            pre = f"{ind}{ord}{os} "
-            content = o.content
+            pre = f"{ind}{i}{os} " if ol else bullet_pre
 
             # Optional display of durability and timestamp (enabled by default)
-            if options.include_durability or options.include_ts:
-                content_items = []
-                if options.include_ts:
-                    content_items.append(o.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
-                if options.include_durability:
-                    content_items.append(o.durability.value)
-                content += f" ({', '.join(content_items)})"
-            post = f"{separator}"
-            result_str += f"{pre}{content}{post}"
-            i += 1
+            if include_ts and include_durability:
+                details = f" ({_format_ts(o.timestamp)}, {o.durability.value})"
+            elif include_ts:
+                details = f" ({_format_ts(o.timestamp)})"
+            elif include_durability:
+                details = f" ({o.durability.value})"
+            else:
+                details = ""
+            parts.append(f"{pre}{o.content}{details}{separator}")
         except Exception as e:
             logger.error(
                 f"Error printing observation {i} from list of {len(observations)} observations: {e}"
             )
-    result_str += epilogue
-    return result_str
+    parts.append(epilogue)
+    return "".join(parts)
 
 
-async def print_email_summaries(
-    email_summaries: list[EmailSummary], options: PrintOptions = PrintOptions()
+def print_email_summaries(
+    email_summaries: list["EmailSummary"], options: PrintOptions = _DEFAULT_PRINT_OPTIONS
 ) -> str:
     """Print email summaries in a readable format."""
     # Resolve formatting options
@@ -486,70 +538,75 @@ async def print_email_summaries(
     else:
         os = " "
 
+    md_links = options.md_links
+    bullet = options.bullet
+    # Continuation lines align with the text after the bullet/ordinal; only ordinals vary in width
+    pre_len = len(ind) + len(os)
+    bullet_ind2 = " " * (pre_len + len(bullet))
+
     lines: list[str] = []
     i = 1
     for summary in email_summaries:
-        ord = str(i) if ol else options.bullet
-        ind2_len = len(ind + ord + os)
-        ind2 = " " * ind2_len if ind2_len > 0 else ""
-        ts = datetime.fromisoformat(summary.timestamp) if summary.timestamp else None
-        if ts:
-            ts = ts.strftime("%Y-%m-%d %H:%M:%S") + " UTC"
-        else:
-            ts = "N/A"
         if not summary.summary:
             logger.error(
                 f"EmailSummary for message ID {summary.message_id} has no content summary!"
             )
             continue
-        lines.append(f"{ind}{ord}{os}Message ID: {summary.message_id}")
-        lines.append(
-            f"{ind2}From: {'[' + summary.from_name + ']' if options.md_links else summary.from_name}"
-            + f"{f'(mailto:{summary.from_address})' if options.md_links else f' ({summary.from_address})'}"
+        if ol:
+            ord = str(i)
+            ind2 = " " * (pre_len + len(ord))
+        else:
+            ord = bullet
+            ind2 = bullet_ind2
+        ts = datetime.fromisoformat(summary.timestamp) if summary.timestamp else None
+        ts = _format_ts(ts) + " UTC" if ts else "N/A"
+        if md_links:
+            sender = f"[{summary.from_name}](mailto:{summary.from_address})"
+        else:
+            sender = f"{summary.from_name} ({summary.from_address})"
+        lines.extend(
+            (
+                f"{ind}{ord}{os}Message ID: {summary.message_id}",
+                f"{ind2}From: {sender}",
+                f"{ind2}Reply-To: {summary.reply_to or 'N/A'}",
+                f"{ind2}Received at: {ts}",
+                f"{ind2}Subject: {summary.subject or ''}",
+                f"{ind2}Content summary: {summary.summary}",
+                f"{ind2}Links:",
+            )
         )
-        lines.append(f"{ind2}Reply-To: {summary.reply_to or 'N/A'}")
-        lines.append(f"{ind2}Received at: {ts}")
-        lines.append(f"{ind2}Subject: {summary.subject or ''}")
-        lines.append(f"{ind2}Content summary: {summary.summary}")
 
-        parsed_links: list[str] = []
+        n_lines = len(lines)
         for link in summary.links or []:
             title = link.get("title", "")
             url = link.get("url", str(link)) or ""
             if not url:
                 continue
-            elif title and url and options.md_links:
-                parsed_links.append(f"{ind2}- [{title}]({url})")
-            elif title and url and not options.md_links:
-                parsed_links.append(f"{ind2}- {title}: {url}")
-            elif not title and url:
-                parsed_links.append(f"{ind2}- {url}")
+            elif title and md_links:
+                lines.append(f"{ind2}- [{title}]({url})")
+            elif title:
+                lines.append(f"{ind2}- {title}: {url}")
             else:
-                continue
-        lines.append(f"{ind2}Links:")
-        lines.append(f"{sep.join(parsed_links)}")
+                lines.append(f"{ind2}- {url}")
+        if len(lines) == n_lines:
+            lines.append("")  # Keep the (empty) links line when there are no links
         i += 1
     return sep.join(lines)
 
 
-async def print_user_info(
-    graph: KnowledgeGraph | None = None,
+def print_user_info(
+    graph: KnowledgeGraph,
     include_observations: bool = True,
-    options: PrintOptions = PrintOptions(),
+    options: PrintOptions = _DEFAULT_PRINT_OPTIONS,
 ):
-    """Get the user's info from the provided knowledge graph (or the default graph from the manager) and print to a string.
+    """Get the user's info from the provided knowledge graph and print to a string.
 
     Args:
-      - graph: The knowledge graph to print user info from. Will load default graph from manager if not provided.
+      - graph: The knowledge graph to print user info from.
       - include_observations: Include observations related to the user in the response.
-      - include_relations: Include relations related to the user in the response.
       - options: The options to use for printing the user info. If not provided, default values will be used.
     """
 
-    if not graph:
-        graph = await manager.read_graph()
-    entity_id_map = await manager.get_entity_id_map(graph)
-
     # Resolve options
     prologue = options.prologue
     epilogue = options.epilogue
@@ -566,35 +623,30 @@ async def print_user_info(
 
     try:
         # Compose a sensible display name for the user, based on available data and preferences
-        last_name = graph.user_info.last_name or ""
-        first_name = graph.user_info.first_name or ""
-        nickname = graph.user_info.nickname or ""
-        preferred_name = graph.user_info.preferred_name or (
+        user_info = graph.user_info
+        last_name = user_info.last_name or ""
+        first_name = user_info.first_name or ""
+        nickname = user_info.nickname or ""
+        preferred_name = user_info.preferred_name or (
             nickname or first_name or last_name or "user"
         )
-        linked_entity_id = graph.user_info.linked_entity_id
-        middle_names = graph.user_info.middle_names or []
-        pronouns = graph.user_info.pronouns or ""
-        emails = graph.user_info.emails or []
-        prefixes = graph.user_info.prefixes or []
-        suffixes = graph.user_info.suffixes or []
-        names = graph.user_info.names or [preferred_name]
-    except Exception as e:
-        raise ToolError(f"Failed to load user info: {e}")
-
-    try:
-        linked_entity = entity_id_map.get(linked_entity_id, None)
+        linked_entity_id = user_info.linked_entity_id
+        middle_names = user_info.middle_names or []
+        pronouns = user_info.pronouns or ""
+        emails = user_info.emails or []
+        prefixes = user_info.prefixes or []
+        suffixes = user_info.suffixes or []
+        names = user_info.names or [preferred_name]
+
+        linked_entity = next((e for e in graph.entities if e.id == linked_entity_id), None)
         if not linked_entity:
             raise KnowledgeGraphException("User-linked entity not found! Graph may be corrupt!")
-    except Exception as e:
-        raise ToolError(f"Failed to get user-linked entity: {e}")
 
-    lines: list[str] = []
-    if prologue:
-        lines.append(prologue)
+        lines: list[str] = []
+        if prologue:
+            lines.append(prologue)
 
-    # Start with printing the user's info
-    try:
+        # Start with printing the user's info
         lines.append(f"{names[0]} (Preferred name: {preferred_name})")
         if middle_names:
             lines.append(f"Middle name(s): {', '.join(middle_names)}")
@@ -612,24 +664,19 @@ async def print_user_info(
                 lines.append(f"{ind}{ord}{os} {name}")
         if emails:
             lines.append(f"Email addresses: {', '.join(emails)}")
-    except Exception as e:
-        raise ToolError(f"Failed to print user info: {e}")
 
-    # Print observations about the user (from the user-linked entity)
-    try:
-        if include_observations and linked_entity:
-            if linked_entity.observations:
-                lines.append("")
-                lines.append(
-                    "" if ctx.settings.no_emojis else "🔍 " + "Observations about the user:"
-                )
-                for o in linked_entity.observations:
-                    ts = o.timestamp.strftime("%Y-%m-%d %H:%M:%S") + " UTC"
-                    lines.append(f"{ind}{ord}{os} {o.content} ({ts}, {o.durability.value})")
-            else:
-                pass  # No observations found in user-linked entity
+        # Print observations about the user (from the user-linked entity)
+        if include_observations and linked_entity.observations:
+            lines.append("")
+            lines.append(f"{_emoji_prefix('🔍')}Observations about the user:")
+            lines.extend(
+                [
+                    f"{ind}{ord}{os} {o.content} ({_format_ts(o.timestamp)} UTC, {o.durability.value})"
+                    for o in linked_entity.observations
+                ]
+            )
     except Exception as e:
-        raise ToolError(f"Failed to print user observations: {e}")
+        raise ToolError(f"Failed to print user info: {e}")
     lines.append(epilogue)
     return separator.join(lines)
 
@@ -649,13 +696,26 @@ async def read_user_info(include_observations: bool = False, include_relations:
       - include_observations: Include observations related to the user in the response.
       - include_relations: Include relations related to the user in the response.
     """
+    key = (manager.graph_version, include_observations, include_relations)
+    cached = _user_info_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        result_str = await print_user_info(
-            include_observations=include_observations, include_relations=include_relations
-        )
+        graph = await manager.read_graph()
+        parts = [print_user_info(graph, include_observations=include_observations)]
+        if include_relations:
+            user_relations = await manager.get_relations_from_id(
+                entity_id=graph.user_info.linked_entity_id, graph=graph
+            )
+            if user_relations:
+                parts.append(f"{_emoji_prefix('🔗')}Relations between the user and other entities:")
+                parts.append(print_relations(graph, relations=user_relations))
     except Exception as e:
         raise ToolError(f"Failed to read user info: {e}")
-    return result_str
+    result = "".join(parts)
+    _user_info_cache.set(key, result)
+    return result
 
 
 @mcp.tool
@@ -685,8 +745,9 @@ async def create_entities(new_entities: list[CreateEntityRequest]):
     Entity IDs are automatically generated by the knowledge graph manager and are unique to each entity. They are not provided in the request.
     Entity IDs provide a way to easily reference specific entities in the knowledge graph.
     """
-    if not isinstance(new_entities, list) or not isinstance(new_entities[0], CreateEntityRequest):
-        raise ToolError("new_entities must be a list of CreateEntityRequest objects")
+    # FastMCP has already validated new_entities as a list of CreateEntityRequest
+    if not new_entities:
+        raise ToolError("No entities provided; nothing created")
 
     try:
         entities_created = await manager.create_entities(new_entities)
@@ -711,12 +772,13 @@ async def create_entities(new_entities: list[CreateEntityRequest]):
         result_str = f"Created {len(succeeded)} entities successfully:\n"
     if len(succeeded) == 0:
         if len(failed) > 0:
-            errmsg = "Request received; however, no new entities were created, due to the following errors:\n"
+            errparts = [
+                "Request received; however, no new entities were created, due to the following errors:\n"
+            ]
             for e in failed:
-                errmsg += f"- {str(e.entity)}:\n"
-                for err in e.errors:
-                    errmsg += f"  - {err}\n"
-            raise ToolError(errmsg)
+                errparts.append(f"- {str(e.entity)}:\n")
+                errparts.extend(f"  - {err}\n" for err in e.errors)
+            raise ToolError("".join(errparts))
         else:
             raise ToolError("Unknown error while creating entities!")
 
@@ -734,25 +796,29 @@ async def create_entities(new_entities: list[CreateEntityRequest]):
             except Exception as e:
                 logger.error(f"Failed to convert entity dict to Entity: {e}")
 
-    result_str += await print_entities(
-        entities=successful_entities, options=PrintOptions(include_observations=True)
-    )
+    parts = [
+        result_str,
+        print_entities(
+            entities=successful_entities,
+            graph=await _graph_if_user(successful_entities),
+            options=_CREATED_ENTITY_OPTIONS,
+        ),
+    ]
 
     if len(failed) == 0:
-        return result_str
+        return "".join(parts)
     elif len(failed) == 1:
-        result_str += "Failed to create entity:\n"
+        parts.append("Failed to create entity:\n")
     else:
-        result_str += f"Failed to create {len(failed)} entities:\n"
+        parts.append(f"Failed to create {len(failed)} entities:\n")
     for r in failed:
-        result_str += f"  - {str(r.entity)}:\n"
+        parts.append(f"  - {str(r.entity)}:\n")
         if r.errors:
-            result_str += "Error(s):\n"
-            for err in r.errors:
-                result_str += f"  - {err}\n"
-        result_str += "\n"
+            parts.append("Error(s):\n")
+            parts.extend(f"  - {err}\n" for err in r.errors)
+        parts.append("\n")
 
-    return result_str
+    return "".join(parts)
 
 
 @mcp.tool
@@ -792,15 +858,17 @@ async def create_relations(new_relations: list[CreateRelationRequest]):
         if not relations or len(relations) == 0:
             return "Request successful; however, no new relations were added!"
         elif len(relations) == 1:
-            result = "Relation created successfully:\n"
+            parts = ["Relation created successfully:\n"]
         else:
-            result = f"Created {len(relations)} relations successfully:\n"
+            parts = [f"Created {len(relations)} relations successfully:\n"]
 
+        use_emojis = not ctx.settings.no_emojis
+        id_map = await manager.get_entity_id_map()
         for r in relations:
-            from_e, to_e = await manager.get_entities_from_relation(r)
-            result += f"{from_e.icon_(use_emojis=not ctx.settings.no_emojis)}{from_e.name} ({from_e.entity_type}) {r.relation} {to_e.icon_(use_emojis=not ctx.settings.no_emojis)}{to_e.name} ({to_e.entity_type})\n"
+            from_e, to_e = id_map.get(r.from_id), id_map.get(r.to_id)
+            parts.append(f"{from_e.icon_(use_emojis)}{from_e.name} ({from_e.entity_type}) {r.relation} {to_e.icon_(use_emojis)}{to_e.name} ({to_e.entity_type})\n")
 
-        return result
+        return "".join(parts)
     except Exception as e:
         raise ToolError(f"Failed to print relations: {e}")
 
@@ -843,6 +911,10 @@ async def add_observations(new_observations: list[ObservationRequest]):
 
     Observations added to non-existent entities will result in the creation of the entity.
     """
+    # The manager returns one result per request, so an empty request is the only way to get none
+    if not new_observations:
+        raise ToolError("No observations provided; nothing added")
+
     try:
         results = await manager.apply_observations(new_observations)
     except Exception as e:
@@ -855,77 +927,54 @@ async def add_observations(new_observations: list[ObservationRequest]):
 
     def dump_bad_entity(entity: Any) -> str:
         if isinstance(entity, dict):
-            try:
-                _ = Entity.from_dict(entity)
-            except Exception:
-                pass
-            else:
-                logger.warning(
-                    f"Dumping entity {str(entity)[:20]}... as bad entity; however, it may be valid"
-                )
-                return json.dumps(
-                    entity.model_dump(
-                        indent=0,
-                        include=IncEx("name", "id", "entity_type"),
-                        exclude_none=True,
-                        exclude_defaults=True,
-                        exclude_unset=True,
-                        warnings=False,
-                    ),
-                    indent=0,
-                    separators=(",", ":"),
-                )
+            return to_json({k: entity[k] for k in _BAD_ENTITY_FIELDS if entity.get(k)}).decode()
 
         elif isinstance(entity, Entity):
+            # Name the entity rather than slicing its repr, which renders every observation first
             logger.error(
-                f"Dumping entity {str(entity)[:20]}... as bad entity; however, it is valid"
+                f"Dumping entity {entity.name} ({entity.id}) as bad entity; however, it is valid"
             )
-            return json.dumps(
-                entity.model_dump(
-                    exclude_none=True, exclude_defaults=True, exclude_unset=True, warnings=False
-                ),
-                indent=0,
-                separators=(",", ":"),
+            # Identify it like the dict placeholders, without serializing its observations
+            return entity.model_dump_json(
+                include=_BAD_ENTITY_FIELDS, exclude_none=True, warnings=False
             )
         else:
             return str(entity)
 
     # Print the results of adding observations to entities
-    result_str = ""
-    if len(failed) == 0 or not failed:
-        if len(succeeded) == 1:
+    def print_succeeded(header: str, id_label: str) -> list[str]:
+        """Return `header` naming the updated entities, followed by their new observations, built in one pass."""
+        idents: list[str] = []
+        details: list[str] = []
+        for s in succeeded:
+            name, entity_id = s.entity.name, s.entity.id
+            idents.append(f"{name} ({id_label}{entity_id})")
+            details.append(f"- {name} (ID: {entity_id}):\n")
+            details.append(print_observations(s.added_observations))
+        return [f"{header} {', '.join(idents)}:\n", *details]
+
+    n_ok, n_bad = len(succeeded), len(failed)
+    if n_bad == 0:
+        if n_ok == 1:
             ident = f"{succeeded[0].entity.name} (ID: {succeeded[0].entity.id})"
-            result_str = f"Succcessfully added observations to {ident}:\n"
-            result_str += await print_observations(succeeded[0].added_observations)
-        elif len(succeeded) > 1:
-            idents = [f"{s.entity.name} ({s.entity.id})" for s in succeeded]
-            result_str = f"Succcessfully added observations to {', '.join(idents)}:\n"
-            for s in succeeded:
-                result_str += f"- {s.entity.name} (ID: {s.entity.id}):\n"
-                result_str += await print_observations(s.added_observations)
+            parts = [
+                f"Succcessfully added observations to {ident}:\n",
+                print_observations(succeeded[0].added_observations),
+            ]
         else:
-            raise ToolError(
-                "Unknown issue while printing observation addition results, however no errors were returned!"
-            )
-    elif len(failed) > 0:
-        if len(succeeded) == 0 and len(failed) > 0:
-            result_str = "Request successful; however, no new observations were added, due to the following errors:\n"
-            for f in failed:
-                result_str += f"- {dump_bad_entity(f.entity)}: {'; '.join(f.errors)}\n"
-            return result_str
-        elif len(succeeded) > 0:
-            idents_succeeded = [f"{s.entity.name} (ID: {s.entity.id})" for s in succeeded]
-            result_str = f"Successfully added observations to {', '.join(idents_succeeded)}:\n"
-            for s in succeeded:
-                result_str += f"- {s.entity.name} (ID: {s.entity.id}):\n"
-                result_str += await print_observations(s.added_observations)
-
-            result_str += f"However, failed to add observations to {len(failed)} entities:\n"
-            for r in failed:
-                result_str += f"- {r.entity.name} (ID: {r.entity.id}): {'; '.join(r.errors)}\n"
-            return result_str
-
-    return result_str
+            parts = print_succeeded("Succcessfully added observations to", "")
+    else:
+        if n_ok == 0:
+            parts = [
+                "Request successful; however, no new observations were added, due to the following errors:\n"
+            ]
+        else:
+            parts = print_succeeded("Successfully added observations to", "ID: ")
+            parts.append(f"However, failed to add observations to {n_bad} entities:\n")
+        for f in failed:
+            parts.append(f"- {dump_bad_entity(f.entity)}: {'; '.join(f.errors)}\n")
+
+    return "".join(parts)
 
 
 # @mcp.tool  # TODO: remove from interface and bury/automate in manager
@@ -981,77 +1030,80 @@ async def delete_entry(request: DeleteEntryRequest):  # TODO: deprecate! ...or n
     """
     entry_type = request.entry_type
     data = request.data
+    if not data:
+        return f"No {entry_type} data provided; nothing deleted"
 
     try:
         if entry_type == "entity":
             try:
-                await manager.delete_entities(data or [])
-            except Exception as e:
+                # Rejects payloads shaped for another entry_type before they reach the manager
+                entity_identifiers = _ENTITY_IDENTIFIERS.validate_python(data)
+                await manager.delete_entities(entity_identifiers)
+            except (KnowledgeGraphException, ValueError) as e:
                 raise ToolError(f"Failed to delete entities: {e}")
             return "Entities deleted successfully"
 
         elif entry_type == "observation":
-            # Ensure data is properly typed as DeleteObservationRequest objects
-            if data is None:
-                data = []
-            # Validate that data contains DeleteObservationRequest objects
-            validated_data = []
-            for item in data:
-                if isinstance(item, DeleteObservationRequest):
-                    validated_data.append(item)
-                else:
-                    # Try to convert dict to DeleteObservationRequest
-                    try:
-                        if isinstance(item, dict):
-                            validated_data.append(DeleteObservationRequest(**item))
-                        else:
-                            logger.error(f"Invalid observation deletion data: {item}")
-                    except Exception as e:
-                        logger.error(f"Failed to convert observation deletion data: {e}")
+            # Validate the whole list in one pass; dicts are converted to DeleteObservationRequest
+            validated_data = _DELETE_OBSERVATIONS.validate_python(data)
             await manager.delete_observations(validated_data)
             return "Observations deleted successfully"
 
         elif entry_type == "relation":
-            await manager.delete_relations(data or [])
+            # Relation instances pass through; payloads shaped for another entry_type are rejected
+            relations = _DELETE_RELATIONS.validate_python(data)
+            await manager.delete_relations(relations)
             return "Relations deleted successfully"
 
         else:
             return ""
-    except Exception as e:
+    except (KnowledgeGraphException, ValueError) as e:
         raise ToolError(f"Failed to delete entry: {e}")
 
 
 @mcp.tool
 async def update_user_info(  # NOTE: feels weird, re-evaluate
-    preferred_name: str | None = Field(description="Provide a new preferred name for the user."),
-    first_name: str | None = Field(
-        default=None, description="Provide a new given name for the user."
-    ),
-    last_name: str | None = Field(
-        default=None, description="Provide a new family name for the user."
-    ),
-    middle_names: list[str] | None = Field(
-        default=None, description="Provide new middle names for the user"
-    ),
-    pronouns: str | None = Field(default=None, description="Provide new pronouns for the user"),
-    nickname: str | None = Field(default=None, description="Provide a new nickname for the user"),
-    prefixes: list[str] | None = Field(
-        default=None, description="Provide new prefixes for the user"
-    ),
-    suffixes: list[str] | None = Field(
-        default=None, description="Provide new suffixes for the user"
-    ),
-    emails: list[str] | None = Field(
-        default=None, description="Provide new email address(es) for the user"
-    ),
-    linked_entity_id: str | None = Field(
-        default=None,
-        description="Provide the ID of the new user-linked entity to represent the user.",
-    ),
-    observations: list[Observation] | None = Field(
-        default=None,
-        description="Optional list of observations to add to the user entity",
-    ),
+    preferred_name: Annotated[
+        str | None,
+        Field(description="Provide a new preferred name for the user."),
+    ],
+    first_name: Annotated[
+        str | None,
+        Field(description="Provide a new given name for the user."),
+    ] = None,
+    last_name: Annotated[
+        str | None,
+        Field(description="Provide a new family name for the user."),
+    ] = None,
+    middle_names: Annotated[
+        list[str] | None,
+        Field(description="Provide new middle names for the user"),
+    ] = None,
+    pronouns: Annotated[str | None, Field(description="Provide new pronouns for the user")] = None,
+    nickname: Annotated[
+        str | None,
+        Field(description="Provide a new nickname for the user"),
+    ] = None,
+    prefixes: Annotated[
+        list[str] | None,
+        Field(description="Provide new prefixes for the user"),
+    ] = None,
+    suffixes: Annotated[
+        list[str] | None,
+        Field(description="Provide new suffixes for the user"),
+    ] = None,
+    emails: Annotated[
+        list[str] | None,
+        Field(description="Provide new email address(es) for the user"),
+    ] = None,
+    linked_entity_id: Annotated[
+        str | None,
+        Field(description="Provide the ID of the new user-linked entity to represent the user."),
+    ] = None,
+    observations: Annotated[
+        list[Observation] | None,
+        Field(description="Optional list of observations to add to the user entity"),
+    ] = None,
 ):
     """
     Update the user's identifying information in the graph. This tool should be rarely called, and
@@ -1110,22 +1162,27 @@ async def update_user_info(  # NOTE: feels weird, re-evaluate
         - Suffixes: "Jr.", "M.D."
         - Email address(es): "john.doe@example.com", "john.doe@work.com"
     """
-    if not preferred_name and not first_name and not nickname and not last_name:
+    if not any((preferred_name, first_name, nickname, last_name)):
         raise ValidationError(
             "Either a preferred name, first name, last name, or nickname are required"
         )
 
+    # Only pass what was provided; from_values defaults the rest to None
     new_user_info_dict = {
-        "preferred_name": preferred_name,
-        "first_name": first_name,
-        "last_name": last_name,
-        "middle_names": middle_names,
-        "pronouns": pronouns,
-        "nickname": nickname,
-        "prefixes": prefixes,
-        "suffixes": suffixes,
-        "emails": emails,
-        "linked_entity_id": linked_entity_id,
+        k: v
+        for k, v in (
+            ("preferred_name", preferred_name),
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("middle_names", middle_names),
+            ("pronouns", pronouns),
+            ("nickname", nickname),
+            ("prefixes", prefixes),
+            ("suffixes", suffixes),
+            ("emails", emails),
+            ("linked_entity_id", linked_entity_id),
+        )
+        if v is not None
     }
 
     try:
@@ -1158,17 +1215,16 @@ async def update_user_info(  # NOTE: feels weird, re-evaluate
                 failed = [r for r in obs_results if r.errors]
 
                 if succeeded:
-                    result_str = (
-                        f"Updated user info and added {len(observations)} observation(s):\n"
+                    parts = [f"Updated user info and added {len(observations)} observation(s):\n"]
+                    parts.extend(
+                        print_observations(s.added_observations)
+                        for s in succeeded
+                        if s.added_observations
                     )
-                    for s in succeeded:
-                        if s.added_observations:
-                            result_str += await print_observations(s.added_observations)
                 else:
-                    result_str = "Updated user info, but failed to add observations:\n"
-                    for f in failed:
-                        if f.errors:
-                            result_str += f"  - {'; '.join(f.errors)}\n"
+                    parts = ["Updated user info, but failed to add observations:\n"]
+                    parts.extend(f"  - {'; '.join(f.errors)}\n" for f in failed if f.errors)
+                result_str = "".join(parts)
             except Exception as e:
                 logger.error(f"Error adding observations to user entity: {e}")
                 result_str = f"Updated user info, but failed to add observations: {e}\n"
@@ -1182,9 +1238,12 @@ async def update_user_info(  # NOTE: feels weird, re-evaluate
 
 @mcp.tool
 async def search_nodes(  # TODO: improve search
-    query: str = Field(
-        description="The search query to match against entity names, aliases, types, and observation content"
-    ),
+    query: Annotated[
+        str,
+        Field(
+            description="The search query to match against entity names, aliases, types, and observation content",
+        ),
+    ],
 ):
     """Search for nodes in the knowledge graph based on a query.
 
@@ -1194,27 +1253,38 @@ async def search_nodes(  # TODO: improve search
     Returns:
         Search results containing matching nodes
     """
+    key = (manager.graph_version, query)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        result = await manager.search_nodes(query)
-        return result.model_dump()
-    except Exception as e:
+        result = await _search_flights.do(key, lambda: manager.search_nodes(query))
+        # Call the pydantic-core serializer directly, skipping model_dump's argument handling
+        dumped = result.__pydantic_serializer__.to_python(result)
+    except (KnowledgeGraphException, ValueError) as e:
         raise ToolError(f"Failed to search nodes: {e}")
+    _search_cache.set(key, dumped)
+    return dumped
 
 
 @mcp.tool
 async def open_nodes(
-    entity_ids: list[str] | str | None = Field(
-        default=None,
-        description="List of IDs of entities to retrieve",
-    ),
-    entity_names: list[str] | str | None = Field(
-        default=None,
-        description="List of names or aliases of entities to retrieve. Prefer to use IDs when appropriate.",
-    ),
-    exclude_relations: bool = Field(
-        default=False,
-        description="Whether to exclude relations from the summary. Relations are included by default.",
-    ),
+    entity_ids: Annotated[
+        list[str] | str | None,
+        Field(description="List of IDs of entities to retrieve"),
+    ] = None,
+    entity_names: Annotated[
+        list[str] | str | None,
+        Field(
+            description="List of names or aliases of entities to retrieve. Prefer to use IDs when appropriate.",
+        ),
+    ] = None,
+    exclude_relations: Annotated[
+        bool,
+        Field(
+            description="Whether to exclude relations from the summary. Relations are included by default.",
+        ),
+    ] = False,
 ):
     """
     Open specific nodes (entities) in the knowledge graph by their IDs, names, or aliases.
@@ -1228,66 +1298,72 @@ async def open_nodes(
     Returns:
         Data (observations) about the nodes (entities) and their relationships (relations) with other nodes in the graph.
     """
-    # Handle entity_ids parameter
-    resolved_ids = []
-    if entity_ids:
-        if isinstance(entity_ids, list):
-            resolved_ids = entity_ids
-        else:
-            # Single string ID
-            resolved_ids = [entity_ids]
-
-    # Handle entity_names parameter
-    resolved_names = []
-    if entity_names:
-        if isinstance(entity_names, list):
-            resolved_names = entity_names
-        else:
-            # Single string name
-            resolved_names = [entity_names]
+    # Normalize up front so equivalent requests share a cache entry and a flight
+    resolved_ids = ensure_string_list(entity_ids)
+    resolved_names = ensure_string_list(entity_names)
+
+    # The same nodes tend to be opened repeatedly within a conversation
+    key = (manager.graph_version, tuple(resolved_ids), tuple(resolved_names), exclude_relations)
+    cached = _open_nodes_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async def load_nodes() -> tuple[list[Entity], KnowledgeGraph]:
+        # One graph load serves both the lookup and the printing below
+        graph = await manager.read_graph()
+        ents = await manager.open_nodes(names=resolved_names, ids=resolved_ids, graph=graph)
+        return ents, graph
 
     try:
-        ents = await manager.open_nodes(names=resolved_names, ids=resolved_ids)
-    except Exception as e:
+        ents, graph = await _open_flights.do(key[:3], load_nodes)
+    except (KnowledgeGraphException, ValueError) as e:
         raise ToolError(f"Failed to open nodes: {e}")
 
     if not exclude_relations:
-        rels = await manager.get_relations_from_entities(entities=ents)
+        rels = await manager.get_relations_from_entities(entities=ents, graph=graph)
     else:
         rels = []
 
     if not ents:
         raise ToolError("No entities found")
+    if len(ents) == 1:
+        header = f"{_emoji_prefix('💭')}You remember the following information about this entity:\n"
     else:
-        if len(ents) == 1:
-            result_str = "💭 You remember the following information about this entity:\n"
-        elif len(ents) > 1:
-            result_str = "💭 You remember the following information about these entities:\n"
-        else:
-            raise ToolError("No entities found")
-        result_str += await print_entities(entities=ents, exclude_user=False)
+        header = f"{_emoji_prefix('💭')}You remember the following information about these entities:\n"
+    parts = [header, print_entities(entities=ents, graph=graph, exclude_user=False)]
     if not rels:
+        # Log names only; the full entity reprs include every observation
         if not exclude_relations:
-            logger.warning(f"No relations found for the opened nodes {str(ents)}")
+            logger.warning(
+                f"No relations found for the opened nodes {', '.join(e.name for e in ents)}"
+            )
         else:
-            logger.info(f"Skipped loading relations for {str(ents)} per llm request")
+            logger.info(
+                f"Skipped loading relations for {', '.join(e.name for e in ents)} per llm request"
+            )
     else:
-        result_str += (
-            "🔗 You've learned about the following relationships between these entities:\n"
+        parts.append(
+            f"{_emoji_prefix('🔗')}You've learned about the following relationships between these entities:\n"
         )
-        result_str += await print_relations(relations=rels)
+        parts.append(print_relations(graph, relations=rels))
 
-    return result_str
+    result = "".join(parts)
+    _open_nodes_cache.set(key, result)
+    return result
 
 
 @mcp.tool
 async def merge_entities(
-    new_entity_name: str = Field(
-        description="Name of the new merged entity (must not conflict with an existing name or alias unless part of the merge)"
-    ),
-    entity_identifiers: list[EntityID | str] | EntityID | str = Field(
-        description="Names, aliases, or IDs of entities to merge into the new entity"
-    ),
+    new_entity_name: Annotated[
+        str,
+        Field(
+            description="Name of the new merged entity (must not conflict with an existing name or alias unless part of the merge)",
+        ),
+    ],
+    entity_identifiers: Annotated[
+        list[EntityID | str] | EntityID | str,
+        Field(description="Names, aliases, or IDs of entities to merge into the new entity"),
+    ],
 ):
     """Merge a list of entities into a new entity with the provided name.
 
@@ -1296,17 +1372,17 @@ async def merge_entities(
     """
     try:
         # Convert entity_identifiers to a list if it's a single value
-        if isinstance(entity_identifiers, (str, EntityID)):
+        # EntityID is an Annotated str, which isinstance() can't check; str covers both
+        if isinstance(entity_identifiers, str):
             entity_identifiers = [entity_identifiers]
 
         # Merge entities using identifiers (names, aliases, or IDs)
         merged = await manager.merge_entities(new_entity_name, entity_identifiers)
-    except Exception as e:
+    except (KnowledgeGraphException, ValueError) as e:
         raise ToolError(f"Failed to merge entities: {e}")
 
-    return_str = f"Successfully merged {len(entity_identifiers)} entities into a new entity:\n"
-    return_str += await print_entities(entities=[merged])
-    return return_str
+    header = f"Successfully merged {len(entity_identifiers)} entities into a new entity:\n"
+    return header + print_entities(entities=[merged], graph=await _graph_if_user([merged]))
 
 
 @mcp.tool
@@ -1346,19 +1422,7 @@ async def update_entity(request: UpdateEntityRequest):
         # Normalize aliases to a list[str] if provided as a string (e.g., stringified JSON array)
         aliases_normalized: list[str] | None
         if isinstance(request.new_aliases, str):
-            try:
-                parsed = json.loads(request.new_aliases)
-                if isinstance(parsed, list):
-                    aliases_normalized = [str(a) for a in parsed]
-                else:
-                    # Fallback: comma-separated string
-                    aliases_normalized = [
-                        s.strip() for s in request.new_aliases.split(",") if s.strip()
-                    ]
-            except Exception:
-                aliases_normalized = [
-                    s.strip() for s in request.new_aliases.split(",") if s.strip()
-                ]
+            aliases_normalized = _parse_aliases(request.new_aliases)
         else:
             aliases_normalized = request.new_aliases
 
@@ -1373,10 +1437,9 @@ async def update_entity(request: UpdateEntityRequest):
         )
 
         # Build a concise human-readable summary
-        result = f"Updated entity: {updated.icon_(use_emojis=not ctx.settings.no_emojis)}{updated.name} ({updated.entity_type})\n"
-        if updated.aliases:
-            result += "  Aliases: " + ", ".join(updated.aliases) + "\n"
-        return result
+        icon = updated.icon_(use_emojis=not ctx.settings.no_emojis)
+        aliases = f"  Aliases: {', '.join(updated.aliases)}\n" if updated.aliases else ""
+        return f"Updated entity: {icon}{updated.name} ({updated.entity_type})\n{aliases}"
     except (KnowledgeGraphException, ValueError) as e:
         raise ToolError(f"Failed to update entity: {e}")
     except Exception as e:
@@ -1385,10 +1448,10 @@ async def update_entity(request: UpdateEntityRequest):
 
 @mcp.tool
 async def delete_relations(
-    relations: list[Relation] | Relation | None = Field(
-        default=None,
-        description="List of relations to remove.",
-    ),
+    relations: Annotated[
+        list[Relation] | Relation | None,
+        Field(description="List of relations to remove."),
+    ] = None,
 ):
     """Remove relations from the knowledge graph. Warning: this is irreversible!"""
     try:
@@ -1399,14 +1462,14 @@ async def delete_relations(
 
 @mcp.tool
 async def delete_entities(
-    entity_names: list[str] | str | None = Field(
-        default=None,
-        description="List of names or aliases of entities to remove.",
-    ),
-    entity_ids: list[EntityID | str] | EntityID | str | None = Field(
-        default=None,
-        description="List of IDs of entities to remove.",
-    ),
+    entity_names: Annotated[
+        list[str] | str | None,
+        Field(description="List of names or aliases of entities to remove."),
+    ] = None,
+    entity_ids: Annotated[
+        list[EntityID | str] | EntityID | str | None,
+        Field(description="List of IDs of entities to remove."),
+    ] = None,
 ):
     """Remove entities from the knowledge graph by name or ID. This will also remove all relations
     involving the entities. This can be useful for cleaning up the graph; however, unless for
@@ -1421,28 +1484,48 @@ async def delete_entities(
 
 
 # Supabase Integration Tools
+def _mark_reviewed_in_background(summaries: list["EmailSummary"]) -> None:
+    """Mark email summaries as reviewed without waiting, skipping any already being marked."""
+    pending = [s for s in summaries if s.message_id not in _reviews_in_flight]
+    if not pending:
+        return
+    ids = {s.message_id for s in pending}
+    _reviews_in_flight.update(ids)
+    logger.info(f"Marking {len(pending)} messages as reviewed")
+    task = asyncio.create_task(manager.mark_as_reviewed(pending))
+    _review_tasks.add(task)
+
+    def _done(t: asyncio.Task) -> None:
+        _review_tasks.discard(t)
+        _reviews_in_flight.difference_update(ids)
+
+    task.add_done_callback(_done)
+
+
 def add_supabase_tools(mcp_server: FastMCP) -> None:
     """If the Supabase integration is enabled, adds the tools to the given MCP server."""
 
     # Tools to be added with successful Supabase integration
     @mcp_server.tool
     async def get_email_summaries(
-        from_date: datetime | str | None = Field(
-            default=None,
-            description=(
-                "Start date for fetching summaries. Accepts 'YYYY-MM-DD', ISO 8601, or relative phrases like 'one week ago'."
+        from_date: Annotated[
+            datetime | str | None,
+            Field(
+                description="Start date for fetching summaries. Accepts 'YYYY-MM-DD', ISO 8601, or relative phrases like 'one week ago'.",
             ),
-        ),
-        to_date: datetime | str | None = Field(
-            default=None,
-            description=(
-                "End date for fetching summaries. Accepts 'YYYY-MM-DD', ISO 8601, or relative phrases like 'yesterday'."
+        ] = None,
+        to_date: Annotated[
+            datetime | str | None,
+            Field(
+                description="End date for fetching summaries. Accepts 'YYYY-MM-DD', ISO 8601, or relative phrases like 'yesterday'.",
             ),
-        ),
-        include_reviewed: bool = Field(
-            default=False,
-            description="Whether to include previously reviewed email summaries. Default is False.",
-        ),
+        ] = None,
+        include_reviewed: Annotated[
+            bool,
+            Field(
+                description="Whether to include previously reviewed email summaries. Default is False.",
+            ),
+        ] = False,
     ):
         """Retrieve and format email summaries from the Supabase integration.
 
@@ -1473,46 +1556,38 @@ def add_supabase_tools(mcp_server: FastMCP) -> None:
             if not s:
                 return None
 
-            # Try ISO 8601 with optional trailing Z
-            s_iso = s
-            if s_iso.endswith("Z"):
-                s_iso = s_iso[:-1] + "+00:00"
+            # Try ISO 8601, including date-only 'YYYY-MM-DD' and a trailing Z
             try:
-                dt = datetime.fromisoformat(s_iso)
+                dt = datetime.fromisoformat(s)
                 if dt.tzinfo is None:
                     dt = dt.replace(tzinfo=timezone.utc)
                 return dt
-            except Exception:
+            except ValueError:
                 pass
 
-            # Try YYYY-MM-DD date-only
-            try:
-                dt = datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                return dt
-            except Exception:
-                pass
+            # Try dates without zero padding, e.g. '2025-1-5'
+            ymd = s.split("-")
+            if len(ymd) == 3 and all(p.isdigit() for p in ymd):
+                try:
+                    return datetime(*map(int, ymd), tzinfo=timezone.utc)
+                except ValueError:
+                    pass
 
             # Simple relative phrases  TODO: improve
             now_utc = datetime.now(timezone.utc)
             s_lower = s.lower()
 
-            if s_lower == "today":
-                return now_utc
-            if s_lower == "yesterday":
-                return now_utc - timedelta(days=1)
+            offset = _RELATIVE_DATES.get(s_lower)
+            if offset is not None:
+                return now_utc - offset
 
-            m = re.match(r"^(?P<num>\d+)\s+day(s)?\s+ago$", s_lower)
+            m = _DAYS_AGO_RE.match(s_lower)
             if m:
-                return now_utc - timedelta(days=int(m.group("num")))
+                return now_utc - timedelta(days=int(m.group(1)))
 
-            m = re.match(r"^(?P<num>\d+)\s+week(s)?\s+ago$", s_lower)
+            m = _WEEKS_AGO_RE.match(s_lower)
             if m:
-                return now_utc - timedelta(weeks=int(m.group("num")))
-
-            if s_lower in {"one day ago", "a day ago"}:
-                return now_utc - timedelta(days=1)
-            if s_lower in {"one week ago", "a week ago", "last week"}:
-                return now_utc - timedelta(weeks=1)
+                return now_utc - timedelta(weeks=int(m.group(1)))
 
             logger.error(f"Unrecognized date format: {dt_str}")
             return None
@@ -1533,71 +1608,59 @@ def add_supabase_tools(mcp_server: FastMCP) -> None:
         if not summaries:
             return "No new email summaries available!"
         else:
-            lines = [f"📧 {len(summaries)} new messages found!"]
+            lines = [f"{_emoji_prefix('📧')}{len(summaries)} new messages found!"]
 
         # Format the email summaries
-        lines.append(await print_email_summaries(summaries))
+        lines.append(print_email_summaries(summaries))
 
         # Mark the messages as reviewed in the background, to save a little time
-        logger.info(f"Marking {len(summaries)} messages as reviewed")
-        asyncio.create_task(manager.mark_as_reviewed(summaries))
+        _mark_reviewed_in_background(summaries)
 
         result = "\n".join(lines) + "\n"
         return result
 
 
-# ----- KEEP AT THE END AFTER OTHER FUNCTIONS -----#
-@mcp.tool
-async def read_graph():
-    """Read and print a user/LLM-friendly summary of the knowledge graph.
-
-    Returns:
-        User/LLM-friendly summary in text/markdown format including:
-          - User info (and observations)
-          - A list of entities
-          - Relations involving the user
-          - Active projects count and most recently accessed project (if project management is enabled)
-          - If Supabase is enabled and the user has any unreviewed email summaries, a single line notice
-            indicating that new email summaries exist (but no summaries are fetched or printed).
+async def _build_graph_sections(graph: KnowledgeGraph) -> list[str]:
     """
-
-    graph = await manager.read_graph()
-
-    # Include current UTC time
-    current_time_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    lines: list[str] = [f"🕐 Current time (UTC): {current_time_utc}", ""]
-
-    # Print user info
-    lines.append("💭 You remember the following information about the user:")
-
-    try:
-        ui_print = await print_user_info(graph=graph)
-        lines.append(ui_print)
-    except Exception as e:
-        raise ToolError(f"Error while printing user info: {e}")
-
-    # Print all entities from the graph
-    try:
-        lines.append(f"👤 You've made observations about {len(graph.entities)} entities:")
-        ent_print = await print_entities(graph=graph)
-        lines.append(ent_print)
-    except Exception as e:
-        raise ToolError(f"Error while printing entities: {e}")
+    Build the sections (lines) of the `read_graph` summary that depend only on the provided graph,
+    in display order: user info, entities, and relations involving the user.
+    """
+    # The print helpers already raise ToolError with their own context
+    sections = [
+        # User info
+        f"{_emoji_prefix('💭')}You remember the following information about the user:",
+        print_user_info(graph),
+        # All entities from the graph
+        f"{_emoji_prefix('👤')}You've made observations about {len(graph.entities)} entities:",
+        print_entities(graph=graph),
+    ]
 
     # Print relations to and from user
     try:
         user_relations = await manager.get_relations_from_id(
-            entity_id=graph.user_info.linked_entity_id
+            entity_id=graph.user_info.linked_entity_id, graph=graph
         )
     except Exception as e:
         raise ToolError(f"Error getting relations from user entity: {e}")
     if user_relations:
-        lines.append(
-            f"🔗 You've learned about {len(user_relations)} relations between the user and these entities:"
+        sections.extend(
+            (
+                f"{_emoji_prefix('🔗')}You've learned about {len(user_relations)} relations between the user and these entities:",
+                print_relations(graph, relations=user_relations),
+            )
         )
-        lines.append(await print_relations(relations=user_relations))
     else:
-        lines.append("(No relations found for user entity - this may be an error!)")
+        sections.append("(No relations found for user entity - this may be an error!)")
+
+    return sections
+
+
+async def _status_sections() -> list[str]:
+    """
+    Build the sections (lines) of the `read_graph` summary that come from outside the graph:
+    project and email notices. These are never cached.
+    """
+    sections: list[str] = []
 
     # Project awareness: Show active projects count and most recently accessed project
     # Note: This is a placeholder for when project management is implemented
@@ -1607,16 +1670,17 @@ async def read_graph():
         if hasattr(manager, "get_projects"):
             active_projects = await manager.get_projects(status=["active"])
             if active_projects:
-                lines.append("")
-                lines.append(f"📊 You have {len(active_projects)} active project(s)")
+                sections.extend(
+                    ("", f"{_emoji_prefix('📊')}You have {len(active_projects)} active project(s)")
+                )
 
                 # Find most recently accessed project (by mtime)
                 if active_projects:
                     most_recent = max(
                         active_projects, key=lambda p: p.mtime if p.mtime else p.ctime
                     )
-                    lines.append(
-                        f"🎯 Most recently accessed: {most_recent.name} ({most_recent.id})"
+                    sections.append(
+                        f"{_emoji_prefix('🎯')}Most recently accessed: {most_recent.name} ({most_recent.id})"
                     )
     except (AttributeError, NotImplementedError):
         # Project management not yet implemented - silently skip
@@ -1631,9 +1695,11 @@ async def read_graph():
         try:
             unreviewed = await manager.get_email_summaries(include_reviewed=False)
             if unreviewed:
-                lines.append("")
-                lines.append(
-                    f"📬 There are {len(unreviewed)} unreviewed email summaries. Use the `get_email_summaries` tool to read them."
+                sections.extend(
+                    (
+                        "",
+                        f"{_emoji_prefix('📬')}There are {len(unreviewed)} unreviewed email summaries. Use the `get_email_summaries` tool to read them.",
+                    )
                 )
         except Exception as e:
             logger.error(f"(Supabase) Error while checking for unreviewed email summaries: {e}")
@@ -1642,31 +1708,74 @@ async def read_graph():
             "(Supabase) Supabase integration is disabled; skipping email summary presence check"
         )
 
-    # Remove any invalid lines (None types, etc.)
-    for line in lines:
-        if not isinstance(line, str):
-            lines.remove(line)
-            continue
-    result = "\n".join(lines)
-    return result
+    return sections
+
+
+# ----- KEEP AT THE END AFTER OTHER FUNCTIONS -----#
+async def _graph_sections(graph: KnowledgeGraph | None = None) -> list[str]:
+    """Return the graph-derived sections of the read_graph summary, cached by graph version."""
+    # The graph part of the summary only changes when the graph does
+    key = manager.graph_version
+    sections = _read_graph_cache.get(key)
+    if sections is None:
+        if graph is None:
+            graph = await manager.read_graph()
+        sections = await _build_graph_sections(graph)
+        _read_graph_cache.set(key, sections)
+    return sections
+
+
+@mcp.tool
+async def read_graph():
+    """Read and print a user/LLM-friendly summary of the knowledge graph.
+
+    Returns:
+        User/LLM-friendly summary in text/markdown format including:
+          - User info (and observations)
+          - A list of entities
+          - Relations involving the user
+          - Active projects count and most recently accessed project (if project management is enabled)
+          - If Supabase is enabled and the user has any unreviewed email summaries, a single line notice
+            indicating that new email summaries exist (but no summaries are fetched or printed).
+    """
+
+    # Include current UTC time
+    current_time_utc = f"{_format_ts(datetime.now(timezone.utc))} UTC"
+    lines: list[str] = [f"{_emoji_prefix('🕐')}Current time (UTC): {current_time_utc}", ""]
+
+    # The graph sections and the status checks (e.g. Supabase email notices) don't depend on each other
+    graph_sections, status_sections = await asyncio.gather(_graph_sections(), _status_sections())
+    lines.extend(graph_sections)
+    lines.extend(status_sections)
+
+    # Every section is a string: the section builders only add text and print helper output
+    return "\n".join(lines)
 
 
 # ----- MAIN APPLICATION ENTRY POINT -----#
 
 
 def _init_manager() -> None:
-    """Initialize the global manager after context is ready."""
+    """Initialize the global manager after context is ready. Later calls reuse the same instance."""
     global manager
-    manager = KnowledgeGraphManager.from_context()
+    if manager is None:
+        manager = KnowledgeGraphManager.from_context()
 
 
 async def startup_check() -> None:
     """Check the startup of the server. Exits with an error if the server will not be able to start."""
     try:
-        _ = await manager._load_graph()
+        graph = await manager._load_graph()
     except Exception as e:
         raise RuntimeError(f"Failed to load graph: {e}")
 
+    # Render the graph part of read_graph from the graph we just loaded, so the first call of a
+    # session doesn't have to load and render it again
+    try:
+        await _graph_sections(graph)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to warm the read_graph cache: {e}")
+
 
 async def start_server():
     """Common entry point for the MCP server."""
@@ -1751,9 +1860,16 @@ async def start_server():
 
 
 def run_sync():
-    """Synchronus entry point for the server."""
-    asyncio.run(start_server())
+    """Synchronus entry point for the server. Runs on uvloop if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(start_server())
 
 
 if __name__ == "__main__":
-    asyncio.run(start_server())
+    run_sync()
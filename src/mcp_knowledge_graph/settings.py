@@ -24,8 +24,6 @@ from pathlib import Path
 from typing import Literal
 import logging as lg
 
-from .version import IQ_MCP_VERSION, IQ_MCP_SCHEMA_VERSION
-
 logger = lg.getLogger("iq-mcp-bootstrap")
 logger.addHandler(lg.FileHandler(Path(__file__).parents[2].resolve() / "iq-mcp-bootstrap.log"))
 logger.setLevel(lg.DEBUG)
@@ -49,6 +47,26 @@ TRANSPORT_ENUM: dict[str, Transport] = {
 }
 
 
+def parse_cli_args() -> argparse.Namespace:
+    """Parse the command-line flags for all settings (core and integrations), ignoring unknown ones."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--memory-path", type=str)
+    parser.add_argument("--debug", action="store_true", default=None)
+    parser.add_argument("--transport", type=str)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--http-host", type=str)
+    parser.add_argument("--http-path", type=str)
+    parser.add_argument("--no-emojis", action="store_true", default=None)
+    parser.add_argument("--dry-run", action="store_true", default=False)
+    parser.add_argument("--url-auth", action="store_true", default=None)
+    # Supabase
+    parser.add_argument("--enable-supabase", action="store_true", default=None)
+    parser.add_argument("--supabase-url", type=str, default=None)
+    parser.add_argument("--supabase-key", type=str, default=None)
+    args, _ = parser.parse_known_args()
+    return args
+
+
 class IQSettings:
     """Core IQ-MCP application settings (transport, memory, logging, etc.).
     Attributes:
@@ -94,10 +112,13 @@ class IQSettings:
 
     # ---------- Construction ----------
     @classmethod
-    def load(cls) -> "IQSettings":
+    def load(cls, args: argparse.Namespace | None = None) -> "IQSettings":
         """
         Create a IQ-MCP Settings instance from CLI args, env, and defaults.
 
+        Args:
+            args: Already-parsed CLI args (see `parse_cli_args`); parsed from `sys.argv` if omitted
+
         Properties:
             debug (bool): Enables verbose logging when True
             transport (Transport enum): Validated transport value ("stdio" | "sse" | "http")
@@ -110,21 +131,8 @@ class IQSettings:
             dry_run (bool): Enable dry-run mode
         """
         # CLI args > Env vars > Defaults
-        parser = argparse.ArgumentParser(add_help=False)
-        parser.add_argument("--memory-path", type=str)
-        parser.add_argument("--debug", action="store_true", default=None)
-        parser.add_argument("--transport", type=str)
-        parser.add_argument("--port", type=int, default=None)
-        parser.add_argument("--http-host", type=str)
-        parser.add_argument("--http-path", type=str)
-        parser.add_argument("--no-emojis", action="store_true", default=None)
-        parser.add_argument("--dry-run", action="store_true", default=False)
-        parser.add_argument("--url-auth", action="store_true", default=None)
-        # Supabase args are parsed separately in SupabaseConfig.load()
-        parser.add_argument("--enable-supabase", action="store_true", default=None)
-        parser.add_argument("--supabase-url", type=str, default=None)
-        parser.add_argument("--supabase-key", type=str, default=None)
-        args, _ = parser.parse_known_args()
+        if args is None:
+            args = parse_cli_args()
 
         # Debug mode
         debug: bool = args.debug or os.environ.get("IQ_DEBUG", "false").lower() == "true"
@@ -229,21 +237,20 @@ class SupabaseConfig:
         self.user_info_table = user_info_table
 
     @classmethod
-    def load(cls, dry_run: bool = False) -> "SupabaseConfig" | None:
+    def load(
+        cls, dry_run: bool = False, args: argparse.Namespace | None = None
+    ) -> "SupabaseConfig" | None:
         """Load Supabase configuration from CLI args and environment variables.
 
         Args:
             dry_run: Whether to enable dry-run mode
+            args: Already-parsed CLI args (see `parse_cli_args`); parsed from `sys.argv` if omitted
 
         Returns:
             SupabaseConfig instance (may be enabled or disabled)
         """
-        # Parse CLI args for Supabase
-        parser = argparse.ArgumentParser(add_help=False)
-        parser.add_argument("--enable-supabase", action="store_true", default=None)
-        parser.add_argument("--supabase-url", type=str, default=None)
-        parser.add_argument("--supabase-key", type=str, default=None)
-        args, _ = parser.parse_known_args()
+        if args is None:
+            args = parse_cli_args()
 
         # Check if Supabase is enabled: CLI > env > default (False)
         enabled = (
@@ -312,11 +319,14 @@ class AppSettings:
     @classmethod
     def load(cls) -> "AppSettings":
         """Load all settings: core + optional integrations."""
+        # Parse the command line once for every settings class
+        args = parse_cli_args()
+
         # Always load core settings
-        core = IQSettings.load()
+        core = IQSettings.load(args)
 
         # Load Supabase config (checks enable flag internally)
-        supabase_config = SupabaseConfig.load(dry_run=core.dry_run)
+        supabase_config = SupabaseConfig.load(dry_run=core.dry_run, args=args)
 
         if not supabase_config:
             return cls(
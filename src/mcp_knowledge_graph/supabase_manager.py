@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from datetime import datetime, timezone
 
@@ -23,6 +24,19 @@ class SupabaseException(Exception):
 class EmailSummary:
     """Object representing an email summary from Supabase."""
 
+    # One of these is built per row fetched; slots keep each instance small
+    __slots__ = (
+        "message_id",
+        "thread_id",
+        "from_address",
+        "from_name",
+        "reply_to",
+        "timestamp",
+        "subject",
+        "summary",
+        "links",
+    )
+
     def __init__(
         self,
         message_id: str,
@@ -122,7 +136,7 @@ class SupabaseManager:
             query = query.gte("received_at", from_ts)
         if to_ts:
             query = query.lte("received_at", to_ts)
-        response = query.execute()
+        response = await asyncio.to_thread(query.execute)
 
         summaries: list[EmailSummary] = []
         try:
@@ -163,11 +177,11 @@ class SupabaseManager:
         email_summary_table = self.settings.email_table
         try:
             email_ids = [message.message_id for message in email_summaries]
-            _ = (
+            await asyncio.to_thread(
                 client.table(email_summary_table)
                 .update({"reviewed": "true"})
                 .in_("message_id", email_ids)
-                .execute()
+                .execute
             )
         except Exception as e:
             logger.error(f"(Supabase) Error marking email summaries as reviewed in Supabase: {e}")
@@ -316,40 +330,42 @@ class SupabaseManager:
         # --- Upsert data (safe: existing data preserved on failure) ---
         # Upsert order: entities -> observations -> relations -> user_info
         # This ensures FK constraints are satisfied (entities must exist before observations/relations reference them)
+        # The client is synchronous, so each request runs in a worker thread to keep the event loop
+        # free; they are still awaited one at a time to preserve that order
         try:
             if entities_payload:
                 # Upsert entities by primary key (id)
-                _ = (
+                await asyncio.to_thread(
                     client.table(entities_table)
                     .upsert(entities_payload, on_conflict="id")
-                    .execute()
+                    .execute
                 )
                 logger.debug(f"(Supabase) Upserted {len(entities_payload)} entities")
 
             if observations_payload:
                 # Upsert observations - requires unique constraint on (linked_entity, content)
-                _ = (
+                await asyncio.to_thread(
                     client.table(observations_table)
                     .upsert(observations_payload, on_conflict="linked_entity,content")
-                    .execute()
+                    .execute
                 )
                 logger.debug(f"(Supabase) Upserted {len(observations_payload)} observations")
 
             if relations_payload:
                 # Upsert relations - requires unique constraint on (from, to, content)
-                _ = (
+                await asyncio.to_thread(
                     client.table(relations_table)
                     .upsert(relations_payload, on_conflict="from,to,content")
-                    .execute()
+                    .execute
                 )
                 logger.debug(f"(Supabase) Upserted {len(relations_payload)} relations")
 
             if user_info_payload:
                 # Upsert user_info by primary key (linked_entity_id)
-                _ = (
+                await asyncio.to_thread(
                     client.table(user_info_table)
                     .upsert(user_info_payload, on_conflict="linked_entity_id")
-                    .execute()
+                    .execute
                 )
                 logger.debug(f"(Supabase) Upserted user info")
 
@@ -376,35 +392,35 @@ class SupabaseManager:
             # Delete orphaned relations (FK-safe: delete relations first)
             if current_entity_ids:
                 # Delete relations where from or to entity no longer exists
-                _ = (
+                await asyncio.to_thread(
                     client.table(relations_table)
                     .delete()
                     .not_.in_("from", current_entity_ids)
-                    .execute()
+                    .execute
                 )
-                _ = (
+                await asyncio.to_thread(
                     client.table(relations_table)
                     .delete()
                     .not_.in_("to", current_entity_ids)
-                    .execute()
+                    .execute
                 )
 
             # Delete orphaned observations (observations for entities that no longer exist)
             if current_entity_ids:
-                _ = (
+                await asyncio.to_thread(
                     client.table(observations_table)
                     .delete()
                     .not_.in_("linked_entity", current_entity_ids)
-                    .execute()
+                    .execute
                 )
 
             # Delete orphaned entities (entities no longer in graph)
             if current_entity_ids:
-                _ = (
+                await asyncio.to_thread(
                     client.table(entities_table)
                     .delete()
                     .not_.in_("id", current_entity_ids)
-                    .execute()
+                    .execute
                 )
 
             logger.debug("(Supabase) Cleaned up orphaned records")
@@ -427,10 +443,18 @@ class SupabaseManager:
         user_info_table = self.settings.user_info_table
 
         try:
-            entities_response = client.table(entities_table).select("*").execute()
-            observations_response = client.table(observations_table).select("*").execute()
-            relations_response = client.table(relations_table).select("*").execute()
-            user_info_response = client.table(user_info_table).select("*").execute()
+            # The client is synchronous; run the four reads concurrently in worker threads over the
+            # client's shared connection pool, rather than one after another on the event loop
+            queries = [
+                client.table(table).select("*")
+                for table in (entities_table, observations_table, relations_table, user_info_table)
+            ]
+            (
+                entities_response,
+                observations_response,
+                relations_response,
+                user_info_response,
+            ) = await asyncio.gather(*(asyncio.to_thread(q.execute) for q in queries))
         except Exception as e:
             logger.error(f"Error loading knowledge graph from Supabase: {e}")
             raise SupabaseException(f"Error loading knowledge graph from Supabase: {e}")
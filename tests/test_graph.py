@@ -44,6 +44,7 @@ def mock_context(temp_memory_dir):
         project_root=Path(temp_memory_dir),
         no_emojis=False,
         dry_run=False,
+        url_auth=False,
     )
 
     # Create AppSettings with core settings and no Supabase
@@ -148,6 +149,11 @@ async def test_search_nodes(mock_context):
     results = await mgr.search_nodes("Acme")
     assert any(e.name == "Acme" for e in results.entities)
 
+    # An exact ID match still returns a graph, containing just that entity
+    acme_id = results.entities[0].id
+    by_id = await mgr.search_nodes(acme_id)
+    assert [e.id for e in by_id.entities] == [acme_id]
+
 
 @pytest.mark.asyncio
 async def test_create_relation(mock_context):
@@ -175,6 +181,35 @@ async def test_create_relation(mock_context):
     assert len(rel_result.relations) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_relations_from_entities(mock_context):
+    """Test that relations are collected for each entity, in graph order."""
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+
+    results = await mgr.create_entities(
+        [
+            CreateEntityRequest(name="Alice", entity_type="person"),
+            CreateEntityRequest(name="Bob", entity_type="person"),
+            CreateEntityRequest(name="Acme", entity_type="organization"),
+        ]
+    )
+    alice, bob, acme = (r.entity for r in results)
+
+    await mgr.create_relations(
+        [
+            CreateRelationRequest(from_entity_id=alice.id, to_entity_id=acme.id, relation="works_at"),
+            CreateRelationRequest(from_entity_id=bob.id, to_entity_id=alice.id, relation="knows"),
+        ]
+    )
+
+    alice_rels = await mgr.get_relations_from_entity(alice)
+    assert [r.relation for r in alice_rels] == ["works_at", "knows"]
+
+    acme_rels = await mgr.get_relations_from_entities([acme, bob])
+    assert [r.relation for r in acme_rels] == ["works_at", "knows"]
+
+
 @pytest.mark.asyncio
 async def test_add_observations(mock_context):
     """Test adding observations to an entity."""
@@ -218,6 +253,32 @@ async def test_observation_deduplication(mock_context):
     assert len(results[0].added_observations) == 1
 
 
+@pytest.mark.asyncio
+async def test_add_observations_unknown_entity(mock_context):
+    """Test that observations for a missing entity are reported without aborting the batch."""
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+
+    await mgr.create_entities([CreateEntityRequest(name="Carol", entity_type="person")])
+
+    results = await mgr.apply_observations(
+        [
+            ObservationRequest(
+                entity_name="Nobody",
+                observations=[Observation.from_values("likes tea", DurabilityType.SHORT_TERM)],
+            ),
+            ObservationRequest(
+                entity_name="Carol",
+                observations=[Observation.from_values("likes tea", DurabilityType.SHORT_TERM)],
+            ),
+        ]
+    )
+
+    assert results[0].errors
+    assert results[0].entity["name"] == "Nobody"
+    assert len(results[1].added_observations) == 1
+
+
 @pytest.mark.asyncio
 async def test_cleanup_outdated_observations(mock_context):
     """Test that fresh observations are not cleaned up."""
@@ -254,6 +315,10 @@ async def test_entity_alias_resolution(mock_context):
     assert len(entities) == 1
     assert entities[0].name == "Robert_Smith"
 
+    # Some clients send lists JSON-encoded
+    entities = await mgr.open_nodes(names='["Bobby"]')
+    assert [e.name for e in entities] == ["Robert_Smith"]
+
 
 @pytest.mark.asyncio
 async def test_persistence_across_sessions(mock_context):
@@ -262,6 +327,8 @@ async def test_persistence_across_sessions(mock_context):
 
     mgr1 = KnowledgeGraphManager(str(mem))
     await mgr1.create_entities([CreateEntityRequest(name="Persistent", entity_type="test")])
+    # Saves go through a temp file that is swapped into place
+    assert not mem.with_name(mem.name + ".tmp").exists()
 
     mgr2 = KnowledgeGraphManager(str(mem))
     entities = await mgr2.open_nodes(names=["Persistent"])
@@ -463,6 +530,36 @@ async def test_delete_relations_with_names(mock_context):
     assert len(graph.relations) == initial_count - 1
 
 
+@pytest.mark.asyncio
+async def test_delete_entities_removes_relations(mock_context):
+    """Test that deleting entities by ID or name also removes their relations."""
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+
+    results = await mgr.create_entities(
+        [
+            CreateEntityRequest(name="Alice", entity_type="person"),
+            CreateEntityRequest(name="Bob", entity_type="person"),
+            CreateEntityRequest(name="Acme", entity_type="organization"),
+        ]
+    )
+    alice, bob, acme = (r.entity for r in results)
+    await mgr.create_relations(
+        [
+            CreateRelationRequest(from_entity_id=alice.id, to_entity_id=acme.id, relation="works_at"),
+            CreateRelationRequest(from_entity_id=bob.id, to_entity_id=acme.id, relation="works_at"),
+        ]
+    )
+
+    # Identifiers may be IDs or names
+    await mgr.delete_entities([alice.id, "Bob"])
+
+    graph = await mgr.read_graph()
+    names = {e.name for e in graph.entities}
+    assert "Alice" not in names and "Bob" not in names and "Acme" in names
+    assert not graph.relations
+
+
 @pytest.mark.asyncio
 async def test_update_user_info_with_observations(mock_context):
     """Test updating user info and adding observations in one call."""
@@ -510,3 +607,90 @@ async def test_read_graph_includes_project_placeholder(mock_context):
     graph = await mgr.read_graph()
     assert graph is not None
     # The project awareness code should gracefully handle the absence of project methods
+
+
+@pytest.mark.asyncio
+async def test_graph_version_changes_on_save(mock_context):
+    """Test that writes bump the graph version used to invalidate cached results."""
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+
+    await mgr.read_graph()
+    before = mgr.graph_version
+    await mgr.search_nodes("Alice")
+    assert mgr.graph_version == before
+
+    await mgr.create_entities([CreateEntityRequest(name="Alice", entity_type="person")])
+    assert mgr.graph_version > before
+
+
+@pytest.mark.asyncio
+async def test_read_during_save_is_not_cached_under_new_version(mock_context):
+    """Test that a result read while a save is in progress is keyed to a version the save retires."""
+    import asyncio
+    from mcp_knowledge_graph.context import ctx
+
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+    await mgr.create_entities([CreateEntityRequest(name="Alice", entity_type="person")])
+
+    class SlowStore:
+        """Remote store whose save blocks until released, and which reads the local file."""
+
+        def __init__(self):
+            self.saving = asyncio.Event()
+            self.release = asyncio.Event()
+
+        async def save_knowledge_graph(self, graph):
+            self.saving.set()
+            await self.release.wait()
+
+        async def get_knowledge_graph(self):
+            return mgr._read_graph_file()
+
+    store = SlowStore()
+    ctx._supabase = store
+    write = asyncio.create_task(
+        mgr.create_entities([CreateEntityRequest(name="Bob", entity_type="person")])
+    )
+    await store.saving.wait()
+
+    # A cached read keys its result by the version seen before loading
+    key = mgr.graph_version
+    stale = await mgr.search_nodes("Bob")
+    assert not any(e.name == "Bob" for e in stale.entities)
+
+    store.release.set()
+    await write
+    assert mgr.graph_version != key
+    assert any(e.name == "Bob" for e in (await mgr.search_nodes("Bob")).entities)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_not_lost(mock_context):
+    """Test that concurrent writes each see the other's changes instead of overwriting them."""
+    import asyncio
+
+    mem = Path(mock_context) / "memory.jsonl"
+    mgr = KnowledgeGraphManager(str(mem))
+
+    await mgr.create_entities([CreateEntityRequest(name="Alice", entity_type="person")])
+
+    await asyncio.gather(
+        *(
+            mgr.apply_observations(
+                [
+                    ObservationRequest(
+                        entity_name="Alice",
+                        observations=[
+                            Observation.from_values(f"fact {i}", DurabilityType.LONG_TERM)
+                        ],
+                    )
+                ]
+            )
+            for i in range(5)
+        )
+    )
+
+    entities = await mgr.open_nodes(names=["Alice"])
+    assert len(entities[0].observations) == 5